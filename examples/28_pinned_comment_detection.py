@@ -29,8 +29,9 @@ def main():
         comments = list(client.get_video_comments(video_url, limit=15))
 
         # Separate pinned and regular comments
-        pinned_comments = [c for c in comments if c.get("is_pinned", False)]
-        regular_comments = [c for c in comments if not c.get("is_pinned", False)]
+        pinned_comments, regular_comments = [], []
+        for c in comments:
+            (pinned_comments if c.get("is_pinned") else regular_comments).append(c)
 
         logger.info(
             f"Found {len(pinned_comments)} pinned comment(s) and {len(regular_comments)} regular comment(s)"
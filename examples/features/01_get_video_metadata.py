@@ -7,14 +7,13 @@ YouTube video. This is the most basic operation in the library.
 Key concepts:
 • Video metadata extraction
 • Error handling for unavailable videos
-• Rich data visualization
+• JSON output of the metadata dictionary
 • Exception handling patterns
 """
 
+import json
 import logging
 
-from rich.pretty import pprint
-
 from yt_meta import YtMeta
 from yt_meta.exceptions import VideoUnavailableError
 
@@ -41,7 +40,8 @@ try:
     # The result is a dictionary containing all the extracted data.
     if video_meta:
         print("\n✅ Video metadata successfully retrieved:")
-        pprint(video_meta)
+        # default=str covers values such as dates that JSON can't encode
+        print(json.dumps(video_meta, indent=2, sort_keys=True, default=str))
     else:
         print("⚠️  No metadata found for this video.")
 
@@ -37,3 +37,17 @@ videos_re = client.get_channel_videos(
 
 for video in itertools.islice(videos_re, 5):
     print(f"- {video.get('title')}")
+
+# --- Example 3: Requiring several terms at once ---
+# Find videos whose title mentions both "open source" and "model".
+# Both terms are checked in one fast filter, so no extra requests are made.
+filters_all = {"title": {"contains_all": ["open source", "model"]}}
+
+print(
+    f"\nFinding videos on {channel_url} with 'open source' AND 'model' in the title..."
+)
+
+videos_all = client.get_channel_videos(channel_url, filters=filters_all, max_videos=50)
+
+for video in itertools.islice(videos_all, 5):
+    print(f"- {video.get('title')}")
@@ -1,3 +1,11 @@
+"""
+Example: Persistent Caching with SQLite
+
+This example shows the speed-up from the built-in SQLite cache, enabled by
+passing `cache_path` to `YtMeta`. The cache runs in WAL mode, so a `-wal` and
+a `-shm` file sit next to the database while it is in use.
+"""
+
 import os
 import shutil
 import time
@@ -12,17 +20,19 @@ DB_FILE = Path("alternative_cache.sqlite")
 
 def clear_cache_files():
     """Removes the cache files if they exist to ensure a clean benchmark."""
-    if DB_FILE.exists():
-        os.remove(DB_FILE)
+    # The cache runs in WAL mode, which keeps -wal and -shm files beside the DB
+    for path in (DB_FILE, Path(f"{DB_FILE}-wal"), Path(f"{DB_FILE}-shm")):
+        if path.exists():
+            os.remove(path)
 
 
 def main():
     """
-    Demonstrates using SqliteDict as a persistent cache, mimicking the 3-step
-    benchmark for clarity.
+    Demonstrates the built-in SQLite cache (`YtMeta(cache_path=...)`),
+    mimicking the 3-step benchmark for clarity.
     """
     clear_cache_files()
-    print("--- Using SqliteDict as a persistent cache backend ---")
+    print("--- Using the built-in SQLite cache as a persistent backend ---")
     print("-" * 50)
 
     # --- Step 1: Initial fetch time with no persistent cache ---
@@ -70,7 +80,7 @@ def main():
 
     # Clean up
     clear_cache_files()
-    print(f"Cleaned up cache files: {DB_FILE} and related journal/cache files.")
+    print(f"Cleaned up cache files: {DB_FILE} and its -wal/-shm files.")
 
 
 if __name__ == "__main__":
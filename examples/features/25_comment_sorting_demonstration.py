@@ -15,27 +15,35 @@ from yt_meta import YtMeta
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
+# Flattens line breaks so each comment preview stays on one line
+_NEWLINES_TO_SPACES = str.maketrans({"\n": " ", "\r": " "})
+
 
 def fetch_and_display_comments(client: YtMeta, video_url: str, sort_by: str):
     """Fetch and display comments using the specified sorting method."""
     try:
         logger.info(f"Fetching comments sorted by: {sort_by}")
 
-        comments = list(client.get_video_comments(video_url, sort_by=sort_by, limit=10))
+        # Comments are consumed as they stream in: the first five are shown
+        # straight away and the rest are only counted, never stored.
+        comments = client.get_video_comments(video_url, sort_by=sort_by, limit=10)
 
         print(f"\n📊 COMMENTS SORTED BY '{sort_by.upper()}':")
         print("=" * 50)
 
-        for i, comment in enumerate(comments[:5], 1):
-            print(f"{i}. @{comment['author']}")
-            print(f"   💬 {comment['text'][:70].replace(chr(10), ' ')}...")
+        count = 0
+        for count, comment in enumerate(comments, 1):
+            if count > 5:
+                continue
+            print(f"{count}. @{comment['author']}")
+            print(f"   💬 {comment['text'][:70].translate(_NEWLINES_TO_SPACES)}...")
             print(
                 f"   👍 {comment['like_count']} likes | 💭 {comment['reply_count']} replies"
             )
             print(f"   📅 {comment['publish_date']}")
             print()
 
-        return len(comments)
+        return count
 
     except Exception as e:
         logger.error(f"Failed to fetch {sort_by} comments: {e}")
@@ -7,9 +7,12 @@ structures by identifying parent-child relationships (replies).
 This helps understand comment thread structure and conversation flow.
 """
 
+import heapq
+import io
 import logging
+import sys
 
-from yt_meta import YtMeta
+from yt_meta import YtMeta, organize_comments
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
@@ -23,67 +26,62 @@ def main():
     try:
         logger.info(f"Fetching comments from: {video_url}")
 
-        # Fetch comments that include replies
-        comments = list(client.get_video_comments(video_url, sort_by="top", limit=30))
-
-        # Organize comments by hierarchy
+        # Fetch comments that include replies, organizing them by hierarchy
+        # as they stream in rather than collecting them into a list first
+        comments = client.get_video_comments(video_url, sort_by="top", limit=30)
         logger.info("Organizing comment hierarchy...")
-        top_level_comments = []
-        replies_by_parent = {}
-
-        for comment in comments:
-            if comment["parent_id"]:
-                # This is a reply
-                parent_id = comment["parent_id"]
-                if parent_id not in replies_by_parent:
-                    replies_by_parent[parent_id] = []
-                replies_by_parent[parent_id].append(comment)
-            else:
-                # This is a top-level comment
-                top_level_comments.append(comment)
-
-        # Display results
-        total_replies = sum(len(replies) for replies in replies_by_parent.values())
-
-        print("\n📊 HIERARCHY SUMMARY:")
-        print(f"Total comments: {len(comments)}")
-        print(f"Top-level comments: {len(top_level_comments)}")
-        print(f"Reply threads: {len(replies_by_parent)}")
-        print(f"Total replies: {total_replies}")
+        comments_by_id, top_level_comments, replies_by_parent, total_replies = (
+            organize_comments(comments)
+        )
+
+        # Display results. The report is assembled in memory and written to
+        # stdout in one go rather than with a separate write per line.
+        report = io.StringIO()
+        print("\n📊 HIERARCHY SUMMARY:", file=report)
+        print(f"Total comments: {len(top_level_comments) + total_replies}", file=report)
+        print(f"Top-level comments: {len(top_level_comments)}", file=report)
+        print(f"Reply threads: {len(replies_by_parent)}", file=report)
+        print(f"Total replies: {total_replies}", file=report)
 
         # Show most active threads
         if replies_by_parent:
-            print("\n💬 MOST ACTIVE THREADS:")
-            # Sort threads by reply count
-            sorted_threads = sorted(
-                replies_by_parent.items(), key=lambda x: len(x[1]), reverse=True
+            print("\n💬 MOST ACTIVE THREADS:", file=report)
+            # Pick the three threads with the most replies
+            sorted_threads = heapq.nlargest(
+                3, replies_by_parent.items(), key=lambda x: len(x[1])
             )
 
-            for i, (parent_id, replies) in enumerate(sorted_threads[:3], 1):
+            for i, (parent_id, replies) in enumerate(sorted_threads, 1):
                 # Find parent comment
-                parent = next(
-                    (c for c in top_level_comments if c["id"] == parent_id), None
-                )
+                parent = comments_by_id.get(parent_id)
                 if parent:
-                    print(f"\n{i}. @{parent['author']} ({len(replies)} replies)")
-                    print(f"   💬 {parent['text'][:70]}...")
-                    print(f"   👍 {parent['like_count']} likes")
+                    print(
+                        f"\n{i}. @{parent['author']} ({len(replies)} replies)",
+                        file=report,
+                    )
+                    print(f"   💬 {parent['text']:.70}...", file=report)
+                    print(f"   👍 {parent['like_count']} likes", file=report)
 
                     # Show first reply
                     if replies:
                         first_reply = replies[0]
                         print(
-                            f"   ↳ @{first_reply['author']}: {first_reply['text'][:50]}..."
+                            f"   ↳ @{first_reply['author']}: {first_reply['text']:.50}...",
+                            file=report,
                         )
                         if len(replies) > 1:
-                            print(f"   ↳ ... and {len(replies) - 1} more replies")
+                            print(
+                                f"   ↳ ... and {len(replies) - 1} more replies",
+                                file=report,
+                            )
 
         # Educational summary
-        print("\n✨ Hierarchical organization helps:")
-        print("• Identify popular discussion topics")
-        print("• Track conversation threads")
-        print("• Find most engaging comments")
-        print("• Understand community interactions")
+        print("\n✨ Hierarchical organization helps:", file=report)
+        print("• Identify popular discussion topics", file=report)
+        print("• Track conversation threads", file=report)
+        print("• Find most engaging comments", file=report)
+        print("• Understand community interactions", file=report)
+        sys.stdout.write(report.getvalue())
 
     except Exception as e:
         logger.error(f"Failed to analyze comment hierarchy: {e}")
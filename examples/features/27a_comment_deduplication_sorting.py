@@ -10,9 +10,12 @@ This technique helps ensure you get both the most popular comments (top) and
 the most recent activity (recent), without duplicates.
 """
 
+import heapq
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 
-from yt_meta import YtMeta
+from yt_meta import YtMeta, organize_comments
 
 
 def main():
@@ -29,59 +32,57 @@ def main():
 
     start_time = time.time()
 
-    # Fetch comments using "top" sorting (most popular)
-    print("📈 Fetching TOP comments (most popular)...")
-    top_comments = list(
-        client.get_video_comments(video_url, sort_by="top", limit=limit_per_sort)
-    )
+    def fetch(sort_by: str) -> list[dict]:
+        return list(
+            client.get_video_comments(video_url, sort_by=sort_by, limit=limit_per_sort)
+        )
 
-    # Fetch comments using "recent" sorting (chronological)
+    # The two sort orders are independent requests, so fetch them
+    # concurrently and let their network round-trips overlap
+    print("📈 Fetching TOP comments (most popular)...")
     print("🕒 Fetching RECENT comments (chronological)...")
-    recent_comments = list(
-        client.get_video_comments(video_url, sort_by="recent", limit=limit_per_sort)
-    )
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        top_future = executor.submit(fetch, "top")
+        recent_future = executor.submit(fetch, "recent")
+        top_comments = top_future.result()
+        recent_comments = recent_future.result()
 
-    end_time = time.time()
+    # Deduplicate by comment ID. "recent" comes second, so its copy of a
+    # comment (with the most recent data) replaces the "top" one.
+    print("🔄 Deduplicating comments...")
+    unique_comments, *_ = organize_comments(chain(top_comments, recent_comments))
 
-    # Combine and deduplicate by comment ID
-    print("\n🔄 Deduplicating comments...")
-    all_comments_dict = {}
+    most_liked = heapq.nlargest(3, top_comments, key=lambda c: c["like_count"])
+    newest = recent_comments[:3]  # "recent" already arrives newest first
 
-    # Add top comments first
-    for comment in top_comments:
-        all_comments_dict[comment["id"]] = comment
-
-    # Add recent comments (overwrites duplicates, keeping most recent data)
-    for comment in recent_comments:
-        all_comments_dict[comment["id"]] = comment
-
-    # Convert back to list
-    unique_comments = list(all_comments_dict.values())
+    end_time = time.time()
 
     # Analysis
-    duplicates_found = len(top_comments) + len(recent_comments) - len(unique_comments)
+    top_count = len(top_comments)
+    recent_count = len(recent_comments)
+    total_fetched = top_count + recent_count
+    duplicates_found = total_fetched - len(unique_comments)
 
     print("\n📊 DEDUPLICATION RESULTS:")
-    print(f"TOP sorting: {len(top_comments)} comments")
-    print(f"RECENT sorting: {len(recent_comments)} comments")
-    print(f"Total fetched: {len(top_comments) + len(recent_comments)} comments")
+    print(f"TOP sorting: {top_count} comments")
+    print(f"RECENT sorting: {recent_count} comments")
+    print(f"Total fetched: {total_fetched} comments")
     print(f"Duplicates found: {duplicates_found}")
     print(f"Unique comments: {len(unique_comments)}")
     print(f"Fetch time: {end_time - start_time:.1f} seconds")
 
     # Show some examples of the different perspectives
     print("\n🔥 TOP 3 MOST POPULAR COMMENTS:")
-    top_sorted = sorted(top_comments, key=lambda x: x["like_count"], reverse=True)
-    for i, comment in enumerate(top_sorted[:3], 1):
+    for i, comment in enumerate(most_liked, 1):
         print(f"{i}. {comment['author']} ({comment['like_count']} likes)")
-        print(f"   {comment['text'][:80]}...")
+        print(f"   {comment['text']:.80}...")
         print()
 
     print("⏰ TOP 3 MOST RECENT COMMENTS:")
-    # Recent comments are already in chronological order (newest first)
-    for i, comment in enumerate(recent_comments[:3], 1):
+    # Recent comments arrive in chronological order (newest first)
+    for i, comment in enumerate(newest, 1):
         print(f"{i}. {comment['author']} ({comment['like_count']} likes)")
-        print(f"   {comment['text'][:80]}...")
+        print(f"   {comment['text']:.80}...")
         print()
 
     # Show benefit of deduplication
@@ -90,7 +91,7 @@ def main():
             f"✅ BENEFIT: By deduplicating, we saved {duplicates_found} redundant comments"
         )
         print(
-            f"   and got {len(unique_comments)} unique comments instead of {len(top_comments) + len(recent_comments)}."
+            f"   and got {len(unique_comments)} unique comments instead of {total_fetched}."
         )
     else:
         print(
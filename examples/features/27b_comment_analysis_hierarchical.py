@@ -9,7 +9,11 @@ This shows how to build a hierarchical view of comment threads and identify
 the most engaging discussions.
 """
 
-from yt_meta import YtMeta
+import heapq
+import io
+import sys
+
+from yt_meta import YtMeta, organize_comments
 
 
 def main():
@@ -22,78 +26,77 @@ def main():
     print(f"Video: {video_url}")
     print()
 
-    # Fetch a reasonable number of comments for analysis
+    # Fetch a reasonable number of comments for analysis, organizing them by
+    # hierarchy as they stream in rather than collecting them into a list first
     print("📥 Fetching comments for analysis...")
-    comments = list(client.get_video_comments(video_url, sort_by="top", limit=80))
-
-    # Organize comments by hierarchy
+    comments = client.get_video_comments(video_url, sort_by="top", limit=80)
     print("🏗️  Organizing comment hierarchy...")
-    comments_by_id = {c["id"]: c for c in comments}
-    top_level_comments = []
-    replies_by_parent = {}
-
-    for comment in comments:
-        if comment["parent_id"]:
-            # This is a reply
-            parent_id = comment["parent_id"]
-            if parent_id not in replies_by_parent:
-                replies_by_parent[parent_id] = []
-            replies_by_parent[parent_id].append(comment)
-        else:
-            # This is a top-level comment
-            top_level_comments.append(comment)
-
-    # Analysis results
-    total_replies = sum(len(replies) for replies in replies_by_parent.values())
-
-    print("\n📊 HIERARCHY ANALYSIS:")
-    print(f"Total comments: {len(comments)}")
-    print(f"Top-level comments: {len(top_level_comments)}")
-    print(f"Reply threads: {len(replies_by_parent)}")
-    print(f"Total replies: {total_replies}")
+    comments_by_id, top_level_comments, replies_by_parent, total_replies = (
+        organize_comments(comments)
+    )
+
+    # Analysis results. The report is assembled in memory and written to
+    # stdout in one go rather than with a separate write per line.
+    report = io.StringIO()
+    print("\n📊 HIERARCHY ANALYSIS:", file=report)
+    print(f"Total comments: {len(top_level_comments) + total_replies}", file=report)
+    print(f"Top-level comments: {len(top_level_comments)}", file=report)
+    print(f"Reply threads: {len(replies_by_parent)}", file=report)
+    print(f"Total replies: {total_replies}", file=report)
 
     # Show most engaging threads
     if replies_by_parent:
-        print("\n💬 TOP 3 MOST ACTIVE THREADS:")
+        print("\n💬 TOP 3 MOST ACTIVE THREADS:", file=report)
         thread_activity = []
         for parent_id, replies in replies_by_parent.items():
             parent_comment = comments_by_id.get(parent_id)
             if parent_comment:
                 thread_activity.append((parent_comment, replies))
 
-        # Sort by number of replies
-        thread_activity.sort(key=lambda x: len(x[1]), reverse=True)
+        # Pick the three threads with the most replies
+        most_active = heapq.nlargest(3, thread_activity, key=lambda x: len(x[1]))
 
-        for i, (parent, replies) in enumerate(thread_activity[:3], 1):
-            print(f"\n{i}. Thread by @{parent['author']} ({len(replies)} replies)")
-            print(f"   Parent: {parent['text'][:70]}...")
-            print(f"   Likes: {parent['like_count']} | Date: {parent['publish_date']}")
+        for i, (parent, replies) in enumerate(most_active, 1):
+            print(
+                f"\n{i}. Thread by @{parent['author']} ({len(replies)} replies)",
+                file=report,
+            )
+            print(f"   Parent: {parent['text']:.70}...", file=report)
+            print(
+                f"   Likes: {parent['like_count']} | Date: {parent['publish_date']}",
+                file=report,
+            )
 
             # Show first 2 replies
             for j, reply in enumerate(replies[:2], 1):
-                print(f"   ↳ Reply {j}: @{reply['author']} - {reply['text'][:50]}...")
+                print(
+                    f"   ↳ Reply {j}: @{reply['author']} - {reply['text']:.50}...",
+                    file=report,
+                )
 
             if len(replies) > 2:
-                print(f"   ↳ ... and {len(replies) - 2} more replies")
+                print(f"   ↳ ... and {len(replies) - 2} more replies", file=report)
 
     # Show top comments by engagement
-    print("\n🔥 TOP 5 COMMENTS BY ENGAGEMENT:")
-    sorted_comments = sorted(
-        top_level_comments, key=lambda x: x["like_count"], reverse=True
+    print("\n🔥 TOP 5 COMMENTS BY ENGAGEMENT:", file=report)
+    # Only five are shown, so select them without sorting every comment
+    sorted_comments = heapq.nlargest(
+        5, top_level_comments, key=lambda x: x["like_count"]
     )
 
-    for i, comment in enumerate(sorted_comments[:5], 1):
+    for i, comment in enumerate(sorted_comments, 1):
         badges = (
             f" [{', '.join(comment['author_badges'])}]"
             if comment["author_badges"]
             else ""
         )
-        print(f"\n{i}. @{comment['author']}{badges}")
+        print(f"\n{i}. @{comment['author']}{badges}", file=report)
         print(
-            f"   💙 {comment['like_count']} likes | 💬 {comment['reply_count']} replies"
+            f"   💙 {comment['like_count']} likes | 💬 {comment['reply_count']} replies",
+            file=report,
         )
-        print(f"   📅 {comment['publish_date']}")
-        print(f"   💭 {comment['text'][:100]}...")
+        print(f"   📅 {comment['publish_date']}", file=report)
+        print(f"   💭 {comment['text']:.100}...", file=report)
 
     # Engagement insights
     if top_level_comments:
@@ -104,24 +107,27 @@ def main():
             top_level_comments
         )
 
-        print("\n📈 ENGAGEMENT INSIGHTS:")
-        print(f"Average likes per top-level comment: {avg_likes:.1f}")
-        print(f"Average replies per top-level comment: {avg_replies:.1f}")
+        print("\n📈 ENGAGEMENT INSIGHTS:", file=report)
+        print(f"Average likes per top-level comment: {avg_likes:.1f}", file=report)
+        print(f"Average replies per top-level comment: {avg_replies:.1f}", file=report)
 
         # Find comments with disproportionate engagement
         high_engagement = [
             c for c in top_level_comments if c["like_count"] > avg_likes * 2
         ]
-        print(f"Comments with 2x+ average likes: {len(high_engagement)}")
+        print(f"Comments with 2x+ average likes: {len(high_engagement)}", file=report)
 
         threaded_comments = [c for c in top_level_comments if c["reply_count"] > 0]
-        print(f"Comments that sparked discussions: {len(threaded_comments)}")
+        print(
+            f"Comments that sparked discussions: {len(threaded_comments)}", file=report
+        )
 
-    print("\n✨ This analysis helps identify:")
-    print("• Most engaging content creators")
-    print("• Topics that generate discussion")
-    print("• Comment threads worth following")
-    print("• Community engagement patterns")
+    print("\n✨ This analysis helps identify:", file=report)
+    print("• Most engaging content creators", file=report)
+    print("• Topics that generate discussion", file=report)
+    print("• Comment threads worth following", file=report)
+    print("• Community engagement patterns", file=report)
+    sys.stdout.write(report.getvalue())
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+import functools
 import json
 import os
 from pathlib import Path
@@ -5,6 +6,7 @@ from pathlib import Path
 import pytest
 
 from yt_meta import YtMeta, parsing
+from yt_meta.utils import _json_loads
 
 
 def make_mock_html(player_response, initial_data, ytcfg=None):
@@ -36,72 +38,76 @@ def make_mock_html(player_response, initial_data, ytcfg=None):
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+# The fixture files are large and never change during a run, so each one is
+# read and parsed once and the fixtures below are session-scoped. Tests must
+# treat the returned data as read-only.
+@functools.cache
+def _load_text(filename):
+    return (FIXTURES_DIR / filename).read_bytes().decode("utf-8")
+
+
+@functools.cache
+def _load_json(filename):
+    # The JSON parser takes bytes directly, skipping a separate decode pass
+    return _json_loads((FIXTURES_DIR / filename).read_bytes())
+
+
+@pytest.fixture(scope="session")
 def channel_page():
-    with open(FIXTURES_DIR / "channel_page.html") as f:
-        return f.read()
+    return _load_text("channel_page.html")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def youtube_channel_initial_data():
-    with open(FIXTURES_DIR / "youtube_channel_initial_data.json") as f:
-        return json.load(f)
+    return _load_json("youtube_channel_initial_data.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def youtube_channel_video_renderers():
-    with open(FIXTURES_DIR / "youtube_channel_video_renderers.json") as f:
-        return json.load(f)
+    return _load_json("youtube_channel_video_renderers.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def youtube_channel_ytcfg():
-    with open(FIXTURES_DIR / "youtube_channel_ytcfg.json") as f:
-        return json.load(f)
+    return _load_json("youtube_channel_ytcfg.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def debug_continuation_response():
-    with open(FIXTURES_DIR / "debug_continuation_response.json") as f:
-        return json.load(f)
+    return _load_json("debug_continuation_response.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def bulwark_channel_video_renderers():
-    with open(FIXTURES_DIR / "bulwark_channel_video_renderers.json") as f:
-        return json.load(f)
+    return _load_json("bulwark_channel_video_renderers.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def aimakerspace_channel_video_renderers():
-    with open(FIXTURES_DIR / "aimakerspace_channel_video_renderers.json") as f:
-        return json.load(f)
+    return _load_json("aimakerspace_channel_video_renderers.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def bulwark_channel_initial_data():
-    with open(FIXTURES_DIR / "bulwark_channel_initial_data.json") as f:
-        return json.load(f)
+    return _load_json("bulwark_channel_initial_data.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def bulwark_channel_ytcfg():
-    with open(FIXTURES_DIR / "bulwark_channel_ytcfg.json") as f:
-        return json.load(f)
+    return _load_json("bulwark_channel_ytcfg.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def video_html():
-    with open(FIXTURES_DIR / "B68agR-OeJM.html") as f:
-        return f.read()
+    return _load_text("B68agR-OeJM.html")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def player_response_data(video_html):
     return parsing.extract_and_parse_json(video_html, "ytInitialPlayerResponse")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def initial_data(video_html):
     return parsing.extract_and_parse_json(video_html, "ytInitialData")
 
@@ -113,8 +119,7 @@ def get_fixture_path(filename):
 
 def get_fixture(filename):
     """Reads and returns the content of a fixture file."""
-    with open(get_fixture_path(filename)) as f:
-        return f.read()
+    return _load_text(filename)
 
 
 @pytest.fixture
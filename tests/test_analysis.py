@@ -0,0 +1,39 @@
+from yt_meta import organize_comments
+
+
+def _comment(comment_id, parent_id=None):
+    return {"id": comment_id, "parent_id": parent_id}
+
+
+def test_organize_comments_groups_replies_under_parents():
+    comments = [
+        _comment("a"),
+        _comment("a.1", "a"),
+        _comment("b"),
+        _comment("a.2", "a"),
+        _comment("b.1", "b"),
+    ]
+
+    comments_by_id, top_level, replies_by_parent, total_replies = organize_comments(
+        comments
+    )
+
+    assert list(comments_by_id) == ["a", "a.1", "b", "a.2", "b.1"]
+    assert [c["id"] for c in top_level] == ["a", "b"]
+    assert {
+        parent: [c["id"] for c in replies]
+        for parent, replies in replies_by_parent.items()
+    } == {"a": ["a.1", "a.2"], "b": ["b.1"]}
+    assert total_replies == 3
+
+
+def test_organize_comments_consumes_a_generator():
+    comments = (_comment(str(i)) for i in range(3))
+
+    comments_by_id, top_level, replies_by_parent, total_replies = organize_comments(
+        comments
+    )
+
+    assert len(comments_by_id) == len(top_level) == 3
+    assert replies_by_parent == {}
+    assert total_replies == 0
@@ -1,7 +1,9 @@
+import threading
 from unittest.mock import MagicMock, patch
 
 from tests.conftest import make_mock_html
 from yt_meta import YtMeta
+from yt_meta.caching import SQLiteCache, TieredCache
 
 
 def test_video_metadata_caching(tmp_path):
@@ -44,6 +46,27 @@ def test_cache_persistence(tmp_path):
     assert client2.cache[key] == value
 
 
+def test_video_metadata_cache_hit_reads_entry_once(tmp_path):
+    """A cache hit reads the stored entry once and makes no request."""
+    client = YtMeta(cache_path=str(tmp_path / "cache.db"))
+    client.cache["video_meta:dQw4w9WgXcQ"] = {"title": "cached"}
+
+    with (
+        patch.object(client.session, "get") as mock_get,
+        patch.object(
+            SQLiteCache,
+            "__getitem__",
+            autospec=True,
+            side_effect=SQLiteCache.__getitem__,
+        ) as mock_read,
+    ):
+        meta = client.get_video_metadata("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+
+    assert meta == {"title": "cached"}
+    assert mock_read.call_count == 1
+    mock_get.assert_not_called()
+
+
 def test_clear_cache(tmp_path):
     """Verify that the cache can be cleared."""
     cache_file = tmp_path / "cache.db"
@@ -98,3 +121,89 @@ def test_channel_page_caching(tmp_path):
         result3 = client.get_channel_metadata(channel_url, force_refresh=True)
         assert mock_get.call_count == 2
         assert result3 is not None
+
+
+def test_sqlite_cache_is_usable_from_other_threads(tmp_path):
+    """Verify that a background thread can write entries the caller then reads."""
+    cache = SQLiteCache(path=str(tmp_path / "cache.db"))
+
+    worker = threading.Thread(target=cache.__setitem__, args=("key", {"a": 1}))
+    worker.start()
+    worker.join()
+
+    assert cache["key"] == {"a": 1}
+
+
+def test_sqlite_cache_uses_write_ahead_log(tmp_path):
+    """Writes are committed to a WAL without a full fsync per commit."""
+    with SQLiteCache(path=str(tmp_path / "cache.db")) as cache:
+        assert cache._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert cache._conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+
+def test_sqlite_cache_clear_removes_all_entries(tmp_path):
+    with SQLiteCache(path=str(tmp_path / "cache.db")) as cache:
+        for i in range(5):
+            cache[f"key{i}"] = i
+        cache.clear()
+        assert len(cache) == 0
+        assert "key0" not in cache
+
+
+def test_sqlite_cache_delete_prefix_removes_only_matching_keys(tmp_path):
+    keys = ["video:", "video:abc", "video;", "videO:abc", "vid", "channel:video:"]
+    with SQLiteCache(path=str(tmp_path / "cache.db")) as cache:
+        for key in keys:
+            cache[key] = key
+        cache.delete_prefix("video:")
+        assert sorted(cache) == sorted(["video;", "videO:abc", "vid", "channel:video:"])
+
+
+def test_tiered_cache_delete_prefix_clears_both_tiers(tmp_path):
+    cache = TieredCache(SQLiteCache(path=str(tmp_path / "cache.db")))
+    cache["video:abc"] = 1
+    cache["channel:xyz"] = 2
+    cache.delete_prefix("video:")
+
+    assert "video:abc" not in cache
+    assert list(cache) == ["channel:xyz"]
+    cache.close()
+
+
+def test_sqlite_cache_close_releases_wal_files(tmp_path):
+    cache_file = tmp_path / "cache.db"
+    cache = SQLiteCache(path=str(cache_file))
+    cache["key"] = "value"
+    cache.close()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["cache.db"]
+    with SQLiteCache(path=str(cache_file)) as reopened:
+        assert reopened["key"] == "value"
+
+
+def test_tiered_cache_serves_hot_entries_from_memory():
+    reads = []
+
+    class Backing(dict):
+        def __getitem__(self, key):
+            reads.append(key)
+            return super().__getitem__(key)
+
+    cache = TieredCache(Backing(), ram_capacity=2)
+    cache["a"] = 1
+    cache["b"] = 2
+
+    assert cache["a"] == 1
+    assert reads == []
+
+    cache["c"] = 3  # Evicts "b", the least recently used entry
+    assert cache["b"] == 2  # Read back from the backing cache
+    assert reads == ["b"]
+    assert len(cache) == 3
+
+
+def test_ytmeta_ram_cache_entries_wraps_sqlite_cache(tmp_path):
+    client = YtMeta(cache_path=str(tmp_path / "cache.db"), ram_cache_entries=16)
+    assert isinstance(client.cache, TieredCache)
+    assert isinstance(client.cache.backing, SQLiteCache)
+    client.cache.close()
@@ -1,3 +1,5 @@
+import threading
+from datetime import date, datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -113,6 +115,165 @@ def test_get_channel_videos_paginates_correctly(channel_fetcher, mocker):
         assert len(videos) == 2
 
 
+def test_get_channel_videos_prefetches_next_page(channel_fetcher):
+    """The next page is requested while the last items of the current one are yielded."""
+    renderers = [
+        {"richItemRenderer": {"content": {"videoRenderer": {"videoId": f"v{i}"}}}}
+        for i in range(3)
+    ] + [
+        {
+            "continuationItemRenderer": {
+                "continuationEndpoint": {"continuationCommand": {"token": "next"}}
+            }
+        }
+    ]
+    initial_data = {
+        "contents": {
+            "twoColumnBrowseResultsRenderer": {
+                "tabs": [
+                    {
+                        "tabRenderer": {
+                            "selected": True,
+                            "content": {"richGridRenderer": {"contents": renderers}},
+                        }
+                    }
+                ]
+            }
+        }
+    }
+    ytcfg = {"INNERTUBE_API_KEY": "test_key"}
+    with (
+        patch.object(channel_fetcher, "_get_continuation_data") as mock_continuation,
+        patch.object(
+            channel_fetcher,
+            "_get_channel_page_data",
+            return_value=(initial_data, ytcfg, "<html></html>"),
+        ),
+    ):
+        mock_continuation.return_value = None
+        videos = channel_fetcher.get_channel_videos("https://any-url.com")
+
+        first = next(videos)
+        channel_fetcher._prefetch_executor.shutdown(wait=True)
+
+        assert first["video_id"] == "v0"
+        mock_continuation.assert_called_once_with("next", ytcfg)
+        assert len(list(videos)) == 2
+
+
+def test_closing_channel_videos_cancels_pending_prefetch(channel_fetcher):
+    """Closing the generator mid-page cancels the next page's prefetch."""
+    renderers = [
+        {"richItemRenderer": {"content": {"videoRenderer": {"videoId": f"v{i}"}}}}
+        for i in range(3)
+    ] + [
+        {
+            "continuationItemRenderer": {
+                "continuationEndpoint": {"continuationCommand": {"token": "next"}}
+            }
+        }
+    ]
+    tab = {
+        "tabRenderer": {
+            "selected": True,
+            "content": {"richGridRenderer": {"contents": renderers}},
+        }
+    }
+    initial_data = {"contents": {"twoColumnBrowseResultsRenderer": {"tabs": [tab]}}}
+    with (
+        patch.object(channel_fetcher, "_prefetch_continuation_data") as mock_prefetch,
+        patch.object(
+            channel_fetcher,
+            "_get_channel_page_data",
+            return_value=(initial_data, {}, "<html></html>"),
+        ),
+    ):
+        videos = channel_fetcher.get_channel_videos("https://any-url.com")
+        next(videos)
+        videos.close()
+
+    mock_prefetch.return_value.cancel.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "videos, stop_conditions",
+    [
+        (
+            [
+                {"video_id": "v0", "publish_date": datetime(2024, 6, 1)},
+                {"video_id": "v1", "publish_date": datetime(2020, 1, 1)},
+            ],
+            {"start_date": date(2024, 1, 1)},
+        ),
+        (
+            [{"video_id": "v0"}, {"video_id": "v1"}],
+            {"stop_at_video_id": "v1"},
+        ),
+    ],
+)
+def test_last_page_is_not_prefetched_past(channel_fetcher, videos, stop_conditions):
+    """A page that can end the listing never prefetches the next one."""
+    with (
+        patch.object(channel_fetcher, "_prefetch_continuation_data") as mock_prefetch,
+        patch.object(channel_fetcher, "_get_continuation_data", return_value=None),
+    ):
+        pages = channel_fetcher._paginate(
+            videos, "next", {}, MagicMock(), **stop_conditions
+        )
+        assert len(list(pages)) == 2
+
+    mock_prefetch.assert_not_called()
+
+
+def test_continuation_data_is_parsed_from_raw_response_bytes(channel_fetcher):
+    """Test that continuation responses are decoded straight from the body bytes."""
+    ytcfg = {"INNERTUBE_API_KEY": "test", "INNERTUBE_CONTEXT": {}}
+    response = channel_fetcher.session.post.return_value
+    response.content = b'{"onResponseReceivedActions": []}'
+
+    result = channel_fetcher._get_continuation_data("token", ytcfg)
+
+    assert result == {"onResponseReceivedActions": []}
+    response.json.assert_not_called()
+
+
+def test_full_metadata_is_fetched_concurrently_in_order(channel_fetcher):
+    """Full metadata requests overlap, but videos keep their listing order."""
+    started = threading.Barrier(3, timeout=5)
+
+    def get_video_metadata(url):
+        if url[-1] in "012":
+            started.wait()  # Only returns once three requests are in flight
+        return {"like_count": int(url[-1])}
+
+    channel_fetcher.video_fetcher.get_video_metadata.side_effect = get_video_metadata
+    listing = [{"video_id": f"v{i}"} for i in range(6)]
+
+    videos = list(
+        channel_fetcher._process_videos_generator(
+            iter(listing), True, {}, {"like_count": {"gte": 1}}, None, 3
+        )
+    )
+
+    assert [v["video_id"] for v in videos] == ["v1", "v2", "v3"]
+    # v0 is filtered out, so only one more page than `max_videos` is needed
+    assert channel_fetcher.video_fetcher.get_video_metadata.call_count == 4
+
+
+def test_full_metadata_is_not_requested_past_stop_video(channel_fetcher):
+    """Nothing after `stop_at_video_id` is requested once the stop video is kept."""
+    get_video_metadata = channel_fetcher.video_fetcher.get_video_metadata
+    get_video_metadata.side_effect = lambda url: {"title": url[-2:]}
+    listing = [{"video_id": f"v{i}"} for i in range(6)]
+
+    videos = list(
+        channel_fetcher._process_videos_generator(iter(listing), True, {}, {}, "v2", -1)
+    )
+
+    assert [v["video_id"] for v in videos] == ["v0", "v1", "v2"]
+    assert get_video_metadata.call_count == 3
+
+
 @pytest.mark.integration
 def test_get_channel_videos_full_metadata_integration(isolated_client: YtMeta):
     """
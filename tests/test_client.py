@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from tests.conftest import get_fixture
-from yt_meta.client import YtMeta
+from yt_meta.client import YtMeta, default_client
 from yt_meta.exceptions import MetadataParsingError, VideoUnavailableError
 
 # Define the path to our test fixture
@@ -177,15 +177,62 @@ def test_ytmeta_initialization():
     assert isinstance(client.cache, DummyCache)
 
 
-def test_ytmeta_initialization_with_cache():
+def test_ytmeta_session_uses_http2_when_available():
+    """Test that the shared session negotiates HTTP/2 if `h2` is installed."""
+    from yt_meta.utils import _HTTP2_AVAILABLE
+
+    with patch("yt_meta.client.Client") as mock_client_class:
+        YtMeta()
+
+    assert mock_client_class.call_args.kwargs["http2"] is _HTTP2_AVAILABLE
+
+
+def test_ytmeta_session_keeps_connections_for_concurrent_fetches():
+    """Test that the session pools enough warm connections for metadata fetches."""
+    from yt_meta.fetchers import FULL_METADATA_CONCURRENCY
+
+    with patch("yt_meta.client.Client") as mock_client_class:
+        YtMeta()
+
+    limits = mock_client_class.call_args.kwargs["limits"]
+    assert limits.max_keepalive_connections == FULL_METADATA_CONCURRENCY
+    assert limits.keepalive_expiry == 30
+
+
+def test_default_client_is_shared():
+    """Test that default_client returns one lazily created, cache-less instance."""
+    client = default_client()
+    from yt_meta.caching import DummyCache
+
+    assert isinstance(client, YtMeta)
+    assert isinstance(client.cache, DummyCache)
+    assert default_client() is client
+
+
+def test_ytmeta_initialization_with_cache(tmp_path):
     """Test YtMeta initialization with a cache object."""
-    client = YtMeta(cache_path="dummy.db")
+    client = YtMeta(cache_path=str(tmp_path / "dummy.db"))
     assert client.cache is not None
     from yt_meta.caching import SQLiteCache
 
     assert isinstance(client.cache, SQLiteCache)
 
 
+def test_ytmeta_context_manager_releases_resources(tmp_path):
+    """Test that leaving the with-block stops prefetching and closes everything."""
+    client = YtMeta(cache_path=str(tmp_path / "cache.db"))
+    executor = MagicMock()
+    client._channel_fetcher._prefetch_executor = executor
+
+    with patch.object(client.cache, "close") as cache_close, client:
+        pass
+
+    executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+    assert client._channel_fetcher._prefetch_executor is None
+    assert client.session.is_closed
+    cache_close.assert_called_once()
+
+
 def test_clear_cache(tmp_path):
     """Test clearing the cache."""
     cache_file = tmp_path / "cache.db"
@@ -1,6 +1,8 @@
+import threading
 from datetime import date
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
+import httpx
 import pytest
 
 from yt_meta.comment_fetcher import BestCommentFetcher
@@ -24,6 +26,41 @@ class TestBestCommentFetcher:
         assert fetcher.api_client.retries == 5
         assert fetcher.parser is not None
 
+    @patch("yt_meta.comment_api_client.httpx.Client")
+    def test_init_configures_keepalive_pool(self, mock_client_class):
+        """Test that the default client keeps connections alive between requests"""
+        BestCommentFetcher()
+
+        kwargs = mock_client_class.call_args.kwargs
+        assert kwargs["limits"].max_keepalive_connections == 8
+        assert kwargs["limits"].keepalive_expiry == 30
+        assert "http2" in kwargs
+
+    def test_init_reuses_injected_client(self):
+        """Test that a shared HTTP client is used as-is and left open"""
+        shared_client = Mock()
+        fetcher_a = BestCommentFetcher(client=shared_client)
+        fetcher_b = BestCommentFetcher(client=shared_client)
+
+        assert fetcher_a.api_client.client is shared_client
+        assert fetcher_b.api_client.client is shared_client
+
+        del fetcher_a
+        shared_client.close.assert_not_called()
+
+    @patch("yt_meta.comment_api_client.httpx.Client")
+    def test_context_manager_closes_own_client(self, mock_client_class):
+        """Test that leaving the with-block closes the fetcher's pooled client"""
+        with BestCommentFetcher() as fetcher:
+            assert fetcher.api_client.client is mock_client_class.return_value
+
+        mock_client_class.return_value.close.assert_called_once()
+
+        shared_client = Mock()
+        with BestCommentFetcher(client=shared_client):
+            pass
+        shared_client.close.assert_not_called()
+
     def test_get_comments_validates_since_date_with_sort_by(self):
         """Test that since_date only works with recent sorting"""
         with pytest.raises(
@@ -40,7 +77,7 @@ class TestBestCommentFetcher:
         """Test proper error handling for unavailable videos"""
         mock_client = Mock()
         mock_client_class.return_value = mock_client
-        mock_client.get.side_effect = Exception("404 Not Found")
+        mock_client.stream.side_effect = Exception("404 Not Found")
 
         fetcher = BestCommentFetcher()
 
@@ -87,12 +124,11 @@ class TestBestCommentFetcher:
             mock_request.return_value = self._create_mock_comment_response()
 
             # Mock the HTTP client
-            with patch.object(self.fetcher.api_client.client, "get") as mock_get:
-                mock_response = Mock()
-                mock_response.text = self._create_mock_html()
-                mock_response.raise_for_status.return_value = None
-                mock_get.return_value = mock_response
-
+            with patch.object(
+                self.fetcher.api_client.client,
+                "stream",
+                return_value=self._mock_page_stream(self._create_mock_html()),
+            ):
                 comments = list(self.fetcher.get_comments("test_id", limit=1))
 
                 assert len(comments) > 0
@@ -158,6 +194,182 @@ class TestBestCommentFetcher:
         assert endpoints["top comments"] == "top_token"
         assert endpoints["newest first"] == "recent_token"
 
+    def test_page_download_stops_after_initial_data(self):
+        """Test that the watch page stream is not read past ytInitialData"""
+        html = self._create_mock_html() + "<footer>" + "x" * 4096 + "</footer>"
+        page = self._mock_page_stream(html)
+        chunks = page.iter_bytes.return_value
+
+        with patch.object(self.fetcher.api_client.client, "stream", return_value=page):
+            initial_data, ytcfg = self.fetcher.api_client.get_initial_video_data("id")
+
+        assert initial_data == {"contents": {"test": "data"}}
+        assert ytcfg["INNERTUBE_API_KEY"] == "test_key"
+        assert len(list(chunks)) > 50  # Most of the footer was never downloaded
+
+    def test_page_scan_handles_blocks_split_across_chunks(self):
+        """Test that the incremental page scan finds blocks cut into tiny chunks"""
+        html = self._create_mock_html() + "<footer>" + "x" * 4096 + "</footer>"
+        page = self._mock_page_stream(html, chunk_size=5)
+        chunks = page.iter_bytes.return_value
+
+        with patch.object(self.fetcher.api_client.client, "stream", return_value=page):
+            initial_data, ytcfg = self.fetcher.api_client.get_initial_video_data("id")
+
+        assert initial_data == {"contents": {"test": "data"}}
+        assert ytcfg["INNERTUBE_CONTEXT"] == {"client": {"clientName": "WEB"}}
+        assert len(list(chunks)) > 800
+
+    def test_ytcfg_is_parsed_once_per_session(self):
+        """Test that later page loads reuse the first ytcfg until it is refreshed"""
+        api_client = self.fetcher.api_client
+        html = self._create_mock_html()
+
+        with (
+            patch.object(
+                api_client.client,
+                "stream",
+                side_effect=lambda *args: self._mock_page_stream(html),
+            ),
+            patch.object(
+                api_client, "_extract_ytcfg", wraps=api_client._extract_ytcfg
+            ) as mock_extract,
+        ):
+            _, first = api_client.get_initial_video_data("video_a")
+            _, second = api_client.get_initial_video_data("video_b")
+            assert second is first
+            assert mock_extract.call_count == 1
+
+            self.fetcher.refresh_context()
+            api_client.get_initial_video_data("video_c")
+            assert mock_extract.call_count == 2
+
+    def test_rejected_api_request_refreshes_context(self):
+        """Test that an HTTP 400 from the API drops the remembered ytcfg"""
+        api_client = self.fetcher.api_client
+        api_client._ytcfg = {"INNERTUBE_API_KEY": "stale", "INNERTUBE_CONTEXT": {}}
+        request = httpx.Request("POST", "https://www.youtube.com/youtubei/v1/next")
+        rejected = httpx.Response(400, request=request)
+
+        with patch.object(api_client.client, "post", return_value=rejected):
+            assert api_client.make_api_request("token", api_client._ytcfg) is None
+
+        assert api_client._ytcfg is None
+
+    def test_retry_after_rejected_request_reloads_video_context(self):
+        """Test that a retry after an HTTP 400 uses a freshly loaded ytcfg"""
+        api_client = self.fetcher.api_client
+        pages = [
+            self._create_mock_html().replace("test_key", key)
+            for key in ("stale_key", "fresh_key")
+        ]
+        request = httpx.Request("POST", "https://www.youtube.com/youtubei/v1/next")
+        responses = [
+            httpx.Response(400, request=request),
+            httpx.Response(
+                200, json=self._create_mock_comment_response(), request=request
+            ),
+        ]
+
+        with (
+            patch.object(
+                api_client.client,
+                "stream",
+                side_effect=lambda *args: self._mock_page_stream(pages.pop(0)),
+            ),
+            patch.object(api_client.client, "post", side_effect=responses) as mock_post,
+            patch.object(
+                api_client,
+                "get_sort_endpoints_flexible",
+                return_value={"top comments": "test_token"},
+            ),
+        ):
+            assert list(self.fetcher.get_comments("test_id", limit=1)) == []
+            retried = list(self.fetcher.get_comments("test_id", limit=1))
+
+        assert len(retried) == 1
+        assert "key=fresh_key" in mock_post.call_args.args[0]
+
+    def test_page_extraction_accepts_raw_bytes(self):
+        """Test that ytcfg and ytInitialData are read from undecoded page bytes"""
+        html = (
+            '<script>ytcfg.set({"INNERTUBE_API_KEY": "k\u00e9y"});</script>'
+            '<script>var ytInitialData = {"title": "caf\u00e9"};</script>'
+        )
+        api_client = self.fetcher.api_client
+
+        for page in (html, html.encode()):
+            assert api_client._extract_ytcfg(page) == {"INNERTUBE_API_KEY": "k\u00e9y"}
+            assert api_client._extract_initial_data(page) == {"title": "caf\u00e9"}
+
+    def test_api_error_page_is_not_decoded(self):
+        """Test that a non-200 response is rejected without parsing its body"""
+        api_client = self.fetcher.api_client
+        ytcfg = {"INNERTUBE_API_KEY": "test", "INNERTUBE_CONTEXT": {}}
+        request = httpx.Request("POST", "https://www.youtube.com/youtubei/v1/next")
+        error_page = httpx.Response(503, content=b"<html>Error</html>", request=request)
+
+        with (
+            patch.object(api_client.client, "post", return_value=error_page),
+            patch("yt_meta.comment_api_client._json_loads") as mock_loads,
+        ):
+            assert api_client.make_reply_request("token", ytcfg) is None
+
+        mock_loads.assert_not_called()
+
+    def test_api_request_parses_raw_response_bytes(self):
+        """Test that comment API responses are decoded straight from the body bytes"""
+        api_client = self.fetcher.api_client
+        ytcfg = {"INNERTUBE_API_KEY": "test", "INNERTUBE_CONTEXT": {}}
+
+        with patch.object(api_client.client, "post") as mock_post:
+            mock_post.return_value.status_code = 200
+            mock_post.return_value.content = b'{"onResponseReceivedEndpoints": []}'
+            response = api_client.make_api_request("token", ytcfg)
+
+        assert response == {"onResponseReceivedEndpoints": []}
+        mock_post.return_value.json.assert_not_called()
+
+    def test_continuation_token_prefers_page_trigger(self):
+        """Test that the next-page token is read from the trailing continuation item"""
+        fetcher = BestCommentFetcher()
+        reply_item = {
+            "continuationItemRenderer": {
+                "continuationEndpoint": {
+                    "continuationCommand": {"token": "replies_token_0123"}
+                }
+            }
+        }
+        response = {
+            "onResponseReceivedEndpoints": [
+                {
+                    "reloadContinuationItemsCommand": {
+                        "continuationItems": [
+                            {"commentThreadRenderer": {"replies": reply_item}},
+                            {
+                                "continuationItemRenderer": {
+                                    "continuationEndpoint": {
+                                        "continuationCommand": {"token": "next_page"}
+                                    }
+                                }
+                            },
+                        ]
+                    }
+                }
+            ]
+        }
+
+        assert fetcher.api_client.extract_continuation_token(response) == "next_page"
+
+    def test_continuation_token_fallback_handles_deep_responses(self):
+        """Test that the full-response token search is not limited by recursion depth"""
+        response = {"continuationCommand": {"token": "comments_token_0123"}}
+        for _ in range(5000):
+            response = {"items": [{"other": "value"}, response]}
+
+        token = self.fetcher.api_client.extract_continuation_token(response)
+        assert token == "comments_token_0123"
+
     def test_surface_key_mapping(self):
         """Test surface key to comment ID mapping functionality"""
         fetcher = BestCommentFetcher()
@@ -253,12 +465,11 @@ class TestBestCommentFetcher:
             mock_endpoints.return_value = {"top": "test_token"}
             mock_request.return_value = self._create_mock_comment_response()
 
-            with patch.object(self.fetcher.api_client.client, "get") as mock_get:
-                mock_response = Mock()
-                mock_response.text = self._create_mock_html()
-                mock_response.raise_for_status.return_value = None
-                mock_get.return_value = mock_response
-
+            with patch.object(
+                self.fetcher.api_client.client,
+                "stream",
+                return_value=self._mock_page_stream(self._create_mock_html()),
+            ):
                 list(
                     self.fetcher.get_comments(
                         "test_id", limit=3, progress_callback=progress_callback
@@ -290,16 +501,121 @@ class TestBestCommentFetcher:
                 num_comments=10
             )
 
-            with patch.object(self.fetcher.api_client.client, "get") as mock_get:
-                mock_response = Mock()
-                mock_response.text = self._create_mock_html()
-                mock_response.raise_for_status.return_value = None
-                mock_get.return_value = mock_response
-
+            with patch.object(
+                self.fetcher.api_client.client,
+                "stream",
+                return_value=self._mock_page_stream(self._create_mock_html()),
+            ):
                 comments = list(self.fetcher.get_comments("test_id", limit=3))
 
                 assert len(comments) == 3
 
+    def test_iter_complete_comments_is_lazy(self):
+        """Test that comments are parsed one at a time as they are consumed"""
+        response = self._create_mock_comment_response(num_comments=5)
+
+        comments = self.fetcher.parser.iter_complete_comments(response)
+        first = next(comments)
+
+        assert first == self.fetcher.parser.extract_complete_comments(response)[0]
+        assert len(list(comments)) == 4
+
+    def test_reply_limit_stops_parsing(self):
+        """Test that replies past `limit` are never parsed"""
+        ytcfg = {"INNERTUBE_API_KEY": "test", "INNERTUBE_CONTEXT": {}}
+        with (
+            patch.object(self.fetcher.api_client, "make_reply_request") as mock_request,
+            patch.object(
+                self.fetcher.parser,
+                "_parse_engagement_count",
+                wraps=self.fetcher.parser._parse_engagement_count,
+            ) as mock_count,
+        ):
+            mock_request.return_value = self._create_mock_comment_response(
+                num_comments=5
+            )
+
+            replies = list(
+                self.fetcher.get_comment_replies(
+                    "test_id", "reply_token", limit=2, ytcfg=ytcfg
+                )
+            )
+
+            assert len(replies) == 2
+            assert all(reply["is_reply"] for reply in replies)
+            # Like and reply counts are parsed once per reply, and only the
+            # two replies within the limit are parsed
+            assert mock_count.call_count == 2 * 2
+            mock_request.assert_called_once()
+
+    def test_prefetched_initial_data_skips_page_load(self):
+        """Test that passing initial_data and ytcfg avoids re-fetching the watch page"""
+        with (
+            patch.object(self.fetcher.api_client, "make_api_request") as mock_request,
+            patch.object(
+                self.fetcher.api_client, "get_initial_video_data"
+            ) as mock_initial,
+            patch.object(
+                self.fetcher.api_client, "get_sort_endpoints_flexible"
+            ) as mock_endpoints,
+        ):
+            mock_endpoints.return_value = {"top": "test_token"}
+            mock_request.return_value = self._create_mock_comment_response(
+                num_comments=2
+            )
+            ytcfg = {"INNERTUBE_API_KEY": "test", "INNERTUBE_CONTEXT": {}}
+
+            comments = list(
+                self.fetcher.get_comments(
+                    "test_id", limit=2, initial_data={"test": "data"}, ytcfg=ytcfg
+                )
+            )
+
+            assert len(comments) == 2
+            mock_initial.assert_not_called()
+            mock_endpoints.assert_called_once_with({"test": "data"}, ytcfg)
+
+    def test_sort_orders_share_one_page_load(self):
+        """Test that fetching the same video with another sort reuses the page data"""
+        with (
+            patch.object(self.fetcher.api_client, "make_api_request") as mock_request,
+            patch.object(
+                self.fetcher.api_client, "get_initial_video_data"
+            ) as mock_initial,
+            patch.object(
+                self.fetcher.api_client, "get_sort_endpoints_flexible"
+            ) as mock_endpoints,
+        ):
+            mock_initial.return_value = ({"test": "data"}, {"INNERTUBE_API_KEY": "k"})
+            mock_endpoints.return_value = {"top": "top_token", "recent": "new_token"}
+            mock_request.return_value = self._create_mock_comment_response(
+                num_comments=1
+            )
+
+            list(self.fetcher.get_comments("test_id", limit=1, sort_by="top"))
+            list(self.fetcher.get_comments("test_id", limit=1, sort_by="recent"))
+
+            mock_initial.assert_called_once_with("test_id")
+            mock_endpoints.assert_called_once()
+            assert mock_request.call_args_list[1].args[0] == "new_token"
+
+    def test_get_comments_many_fetches_videos_concurrently(self):
+        """Test that several videos are fetched at once and failures are skipped"""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_get_comments(video_id, limit=None, sort_by="top"):
+            if video_id == "missing":
+                raise VideoUnavailableError("gone")
+            barrier.wait()  # Only returns once both videos are in flight
+            yield {"id": f"{video_id}-c1"}
+
+        with patch.object(self.fetcher, "get_comments", side_effect=fake_get_comments):
+            results = dict(
+                self.fetcher.get_comments_many(["vid_a", "missing", "vid_b"], limit=5)
+            )
+
+        assert results == {"vid_a": [{"id": "vid_a-c1"}], "vid_b": [{"id": "vid_b-c1"}]}
+
     def test_since_date_filtering(self):
         """Test that since_date filtering works correctly"""
         cutoff_date = date(2023, 1, 1)
@@ -322,12 +638,11 @@ class TestBestCommentFetcher:
             # Create response with comments before and after cutoff
             mock_request.return_value = self._create_mock_comment_response_with_dates()
 
-            with patch.object(self.fetcher.api_client.client, "get") as mock_get:
-                mock_response = Mock()
-                mock_response.text = self._create_mock_html()
-                mock_response.raise_for_status.return_value = None
-                mock_get.return_value = mock_response
-
+            with patch.object(
+                self.fetcher.api_client.client,
+                "stream",
+                return_value=self._mock_page_stream(self._create_mock_html()),
+            ):
                 comments = list(
                     self.fetcher.get_comments(
                         "test_id", sort_by="recent", since_date=cutoff_date
@@ -339,6 +654,16 @@ class TestBestCommentFetcher:
                     if comment["publish_date"]:
                         assert comment["publish_date"] >= cutoff_date
 
+    def _mock_page_stream(self, html, chunk_size=64):
+        """Create a mock streaming response serving the HTML in small chunks"""
+        data = html.encode()
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.iter_bytes.return_value = iter(
+            [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+        )
+        return mock_response
+
     def _create_mock_html(self):
         """Create mock HTML with required ytcfg and initial data"""
         return """
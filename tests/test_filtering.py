@@ -1,7 +1,9 @@
+from datetime import date, datetime
+
 import pytest
 
-from yt_meta import YtMeta
-from yt_meta.filtering import apply_filters, partition_filters
+from yt_meta import YtMeta, filtering
+from yt_meta.filtering import apply_filters, compile_filters, partition_filters
 
 # --- Unit Tests for apply_filters ---
 
@@ -77,6 +79,48 @@ def test_no_duration_fails(sample_video):
     assert apply_filters(sample_video, filters) is False
 
 
+def test_title_contains_all_and_any(sample_video):
+    assert apply_filters(sample_video, {"title": {"contains_all": ["great", "VIDEO"]}})
+    assert not apply_filters(
+        sample_video, {"title": {"contains_all": ["great", "bad"]}}
+    )
+    assert apply_filters(sample_video, {"title": {"contains_any": ["bad", "great"]}})
+    assert not apply_filters(sample_video, {"title": {"contains_any": ["bad", "poor"]}})
+
+
+def test_keywords_contains_any_and_all():
+    video = {"keywords": ["Python", "AI", "Tutorial"]}
+    assert apply_filters(video, {"keywords": {"contains_any": ["rust", "ai"]}})
+    assert not apply_filters(video, {"keywords": {"contains_any": ["rust", "go"]}})
+    assert apply_filters(video, {"keywords": {"contains_all": ["python", "TUTORIAL"]}})
+    assert not apply_filters(video, {"keywords": {"contains_all": ["python", "go"]}})
+
+
+def test_compile_filters_matches_apply_filters(sample_video):
+    filters = {"view_count": {"gt": 10000}, "title": {"contains": "great"}}
+    passes = compile_filters(filters)
+    assert passes(sample_video) is apply_filters(sample_video, filters) is True
+    assert passes({**sample_video, "view_count": 5}) is False
+    assert passes({"view_count": 20000}) is False
+
+
+def test_compile_filters_parses_filter_dates_once(mocker):
+    parse = mocker.spy(filtering.dateparser, "parse")
+    passes = compile_filters(
+        {"publish_date": {"gte": "2024-01-01", "lt": "2025-01-01"}}
+    )
+
+    assert passes({"publish_date": date(2024, 6, 1)}) is True
+    assert passes({"publish_date": datetime(2023, 12, 31, 12)}) is False
+    assert passes({"publish_date": date(2025, 1, 1)}) is False
+    assert parse.call_count == 2
+
+
+@pytest.mark.parametrize("filters", [None, {}])
+def test_compile_filters_without_filters_passes_everything(filters):
+    assert compile_filters(filters)({}) is True
+
+
 # --- Integration Test ---
 
 
@@ -1,8 +1,10 @@
+import itertools
 from pathlib import Path
 
 import pytest
 
 from yt_meta import parsing
+from yt_meta.fetchers import PlaylistFetcher
 from yt_meta.utils import _deep_get
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -110,6 +112,25 @@ def test_get_playlist_videos_stops_at_id(client, mocker):
     assert videos[2]["video_id"] == "vid3"
 
 
+def test_playlist_prefetches_next_page_near_end_of_page(mocker):
+    html = (FIXTURES_DIR / "playlist_page.html").read_text()
+    session = mocker.Mock()
+    session.get.return_value.text = html
+    fetcher = PlaylistFetcher(session=session, cache={}, video_fetcher=mocker.Mock())
+    mock_continuation = mocker.patch.object(
+        fetcher, "_get_continuation_data", return_value=None
+    )
+
+    videos = fetcher._get_raw_playlist_videos_generator("any_playlist_id")
+    first_videos = list(itertools.islice(videos, 90))
+    mock_continuation.assert_not_called()
+
+    next(videos)  # Ten videos left on the page: the next one is requested
+    fetcher._prefetch_executor.shutdown(wait=True)
+    mock_continuation.assert_called_once()
+    assert len(first_videos) + 1 + len(list(videos)) == 100
+
+
 @pytest.mark.integration
 def test_get_playlist_videos(isolated_client):
     """Test fetching videos from a live playlist."""
@@ -0,0 +1,71 @@
+# tests/test_utils.py
+import json
+import math
+
+import pytest
+
+from yt_meta.utils import _deep_get, _iter_dicts, _json_loads, extract_video_id
+
+
+def test_iter_dicts_visits_in_document_order():
+    """Tests that nested dicts are yielded depth-first, in document order."""
+    data = {
+        "a": {"id": 1, "child": {"id": 2}},
+        "b": [{"id": 3}, [{"id": 4}], "text", 5],
+        "c": {"id": 5},
+    }
+    ids = [d["id"] for d in _iter_dicts(data) if "id" in d]
+    assert ids == [1, 2, 3, 4, 5]
+
+
+def test_iter_dicts_handles_deep_nesting():
+    """Tests that deeply nested structures don't hit the recursion limit."""
+    data = leaf = {}
+    for _ in range(5000):
+        leaf["next"] = {}
+        leaf = leaf["next"]
+    leaf["found"] = True
+    assert any(d.get("found") for d in _iter_dicts(data))
+
+
+def test_json_loads_matches_stdlib():
+    """Tests that the JSON helper agrees with json.loads, including NaN literals."""
+    text = '{"a": [1, 2.5, "x", null, true], "b": {"c": "\\u00e9"}}'
+    assert _json_loads(text) == json.loads(text)
+    assert _json_loads(text.encode()) == json.loads(text)
+    assert math.isnan(_json_loads('{"n": NaN}')["n"])
+
+
+def test_json_loads_raises_stdlib_error():
+    """Tests that invalid JSON raises json.JSONDecodeError."""
+    with pytest.raises(json.JSONDecodeError):
+        _json_loads("{not json")
+
+
+def test_deep_get_accepts_string_and_tuple_paths():
+    """Tests that dotted strings and key tuples resolve to the same value."""
+    data = {"a": {"b": [{"c": 1}, {"c": 2}]}}
+    assert _deep_get(data, "a.b.1.c") == 2
+    assert _deep_get(data, ("a", "b", "1", "c")) == 2
+    assert _deep_get(data, "a.b.5.c", default="missing") == "missing"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42s",
+        "https://www.youtube.com/shorts/dQw4w9WgXcQ?feature=share",
+        "https://youtu.be/dQw4w9WgXcQ?si=abc",
+    ],
+)
+def test_extract_video_id(url):
+    """Tests that the video ID is extracted from the supported URL forms."""
+    assert extract_video_id(url) == "dQw4w9WgXcQ"
+
+
+def test_extract_video_id_rejects_unknown_url():
+    """Tests that an unrecognised URL raises a ValueError."""
+    with pytest.raises(ValueError):
+        extract_video_id("https://www.youtube.com/@channel")
@@ -45,6 +45,32 @@ def test_validate_filters_invalid_value_type():
         validate_filters(filters)
 
 
+def test_validate_filters_list_operators_on_text_fields():
+    """Test that text fields accept list operators given a list of strings."""
+    validate_filters({"title": {"contains": "test", "contains_all": ["te", "st"]}})
+
+    # List operator on a text field with a string value
+    filters = {"title": {"contains_all": "not_a_list"}}
+    with pytest.raises(TypeError, match="Invalid value type for 'title' filter"):
+        validate_filters(filters)
+
+
+def test_validate_filters_list_operator_needs_strings():
+    """Test that list operators reject lists holding non-string values."""
+    for field in ("title", "keywords"):
+        filters = {field: {"contains_any": ["ok", 1]}}
+        with pytest.raises(TypeError, match=f"Invalid value type for '{field}'"):
+            validate_filters(filters)
+
+
+def test_validate_filters_list_operator_rejects_empty_list():
+    """Test that an empty list is rejected for text and list fields alike."""
+    for field in ("title", "keywords"):
+        for op in ("contains_any", "contains_all"):
+            with pytest.raises(ValueError, match="needs a non-empty list"):
+                validate_filters({field: {op: []}})
+
+
 def test_validate_filters_valid_filters():
     """Test that a valid set of filters passes validation without error."""
     filters = {
@@ -1,6 +1,7 @@
 # yt_meta/__init__.py
 
-from .client import YtMeta
+from .analysis import organize_comments
+from .client import YtMeta, default_client
 from .comment_api_client import CommentAPIClient
 from .comment_fetcher import BestCommentFetcher, CommentFetcher
 from .comment_parser import CommentParser
@@ -11,9 +12,11 @@ __version__ = "0.3.1"
 
 __all__ = [
     "YtMeta",
+    "default_client",
     "MetadataParsingError",
     "VideoUnavailableError",
     "parse_relative_date_string",
+    "organize_comments",
     "CommentFetcher",
     "BestCommentFetcher",  # Backward compatibility
     "CommentAPIClient",
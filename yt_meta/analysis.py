@@ -0,0 +1,41 @@
+# yt_meta/analysis.py
+"""
+Helpers for analysing comments after they have been fetched.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+
+def organize_comments(
+    comments: Iterable[dict],
+) -> tuple[dict[str, dict], list[dict], dict[str, list[dict]], int]:
+    """
+    Groups comments into reply threads in a single pass.
+
+    Args:
+        comments: Comment dictionaries as yielded by `YtMeta.get_video_comments`.
+            Each must have an `id` and a `parent_id` (falsy for top-level
+            comments).
+
+    Returns:
+        A tuple `(comments_by_id, top_level_comments, replies_by_parent,
+        total_replies)`: every comment keyed by its ID, the top-level comments
+        in input order, the replies in input order keyed by the ID of the
+        comment they reply to, and the number of replies.
+    """
+    comments_by_id = {}
+    top_level_comments = []
+    replies_by_parent = defaultdict(list)
+    total_replies = 0
+
+    for comment in comments:
+        comments_by_id[comment["id"]] = comment
+        parent_id = comment["parent_id"]
+        if parent_id:
+            replies_by_parent[parent_id].append(comment)
+            total_replies += 1
+        else:
+            top_level_comments.append(comment)
+
+    return comments_by_id, top_level_comments, dict(replies_by_parent), total_replies
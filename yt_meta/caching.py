@@ -1,7 +1,10 @@
 import logging
 import pickle
 import sqlite3
+import sys
+import threading
 import time
+from collections import OrderedDict
 from collections.abc import MutableMapping
 from pathlib import Path
 
@@ -27,16 +30,43 @@ class DummyCache(MutableMapping):
         return 0
 
 
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """
+    Return the smallest string greater than every string starting with `prefix`.
+
+    Returns None when no such string exists (the prefix is made only of the
+    highest code point), in which case the range has no upper end.
+    """
+    stripped = prefix.rstrip(chr(sys.maxunicode))
+    if not stripped:
+        return None
+    next_code = ord(stripped[-1]) + 1
+    if 0xD800 <= next_code <= 0xDFFF:  # Surrogates can't be stored as UTF-8
+        next_code = 0xE000
+    return stripped[:-1] + chr(next_code)
+
+
 class SQLiteCache(MutableMapping):
     """
     A cache that uses SQLite as a backend.
+
+    The connection is shared between threads (fetchers prefetch pages in the
+    background), so every statement runs under a lock.
+
+    The database uses write-ahead logging with `synchronous=NORMAL`, so the
+    commit after each write appends to the log without forcing an fsync.
+    A crash can lose the most recent writes, which for a cache only means
+    fetching them again.
     """
 
     def __init__(self, path=".my_yt_meta_cache/cache.db", ttl_seconds=86400):
         self.path = path
         self.ttl_seconds = ttl_seconds
         Path(self.path).parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(self.path)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
         self._conn.execute(
             "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, timestamp REAL)"
         )
@@ -45,36 +75,153 @@ class SQLiteCache(MutableMapping):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self._conn.close()
+        self.close()
+
+    def close(self):
+        """Closes the database connection, checkpointing the write-ahead log."""
+        with self._lock:
+            self._conn.close()
 
     def __getitem__(self, key):
-        cursor = self._conn.execute(
-            "SELECT value, timestamp FROM cache WHERE key = ?", (key,)
-        )
-        result = cursor.fetchone()
-        if result is None:
-            raise KeyError(key)
-        value, timestamp = result
-        if timestamp < time.time() - self.ttl_seconds:
-            self.__delitem__(key)
-            raise KeyError(key)
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT value, timestamp FROM cache WHERE key = ?", (key,)
+            )
+            result = cursor.fetchone()
+            if result is None:
+                raise KeyError(key)
+            value, timestamp = result
+            if timestamp < time.time() - self.ttl_seconds:
+                self.__delitem__(key)
+                raise KeyError(key)
         return pickle.loads(value)
 
     def __setitem__(self, key, value):
-        self._conn.execute(
-            "INSERT OR REPLACE INTO cache (key, value, timestamp) VALUES (?, ?, ?)",
-            (key, pickle.dumps(value), time.time()),
-        )
-        self._conn.commit()
+        data = pickle.dumps(value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, timestamp) VALUES (?, ?, ?)",
+                (key, data, time.time()),
+            )
+            self._conn.commit()
 
     def __delitem__(self, key):
-        self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
-        self._conn.commit()
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self):
+        """Removes every entry with a single DELETE rather than one per key."""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+
+    def delete_prefix(self, prefix: str):
+        """
+        Removes every entry whose key starts with `prefix` in a single DELETE.
+
+        Those keys form one contiguous range of the primary-key index, so
+        SQLite visits only the matching rows instead of every key.
+        """
+        upper = _prefix_upper_bound(prefix)
+        with self._lock:
+            if upper is None:
+                self._conn.execute("DELETE FROM cache WHERE key >= ?", (prefix,))
+            else:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE key >= ? AND key < ?", (prefix, upper)
+                )
+            self._conn.commit()
 
     def __iter__(self):
-        cursor = self._conn.execute("SELECT key FROM cache")
-        return (row[0] for row in cursor)
+        with self._lock:
+            rows = self._conn.execute("SELECT key FROM cache").fetchall()
+        return (row[0] for row in rows)
 
     def __len__(self):
-        cursor = self._conn.execute("SELECT COUNT(*) FROM cache")
-        return cursor.fetchone()[0]
+        with self._lock:
+            cursor = self._conn.execute("SELECT COUNT(*) FROM cache")
+            return cursor.fetchone()[0]
+
+
+class TieredCache(MutableMapping):
+    """
+    An in-memory LRU tier in front of another cache.
+
+    Reads are served from memory when possible; misses fall through to the
+    backing cache and are promoted. Writes and deletes go to both tiers, so
+    the backing cache always holds every entry.
+
+    Values held in memory are returned as-is rather than copied, and they do
+    not expire with the backing cache's TTL while the process runs.
+    """
+
+    def __init__(self, backing: MutableMapping, ram_capacity: int = 4096):
+        self.backing = backing
+        self.ram_capacity = ram_capacity
+        self._ram: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._ram[key] = value
+            self._ram.move_to_end(key)
+            if len(self._ram) > self.ram_capacity:
+                self._ram.popitem(last=False)
+
+    def __getitem__(self, key):
+        with self._lock:
+            if key in self._ram:
+                self._ram.move_to_end(key)
+                return self._ram[key]
+        value = self.backing[key]
+        self._remember(key, value)
+        return value
+
+    def __setitem__(self, key, value):
+        self.backing[key] = value
+        self._remember(key, value)
+
+    def __delitem__(self, key):
+        with self._lock:
+            self._ram.pop(key, None)
+        del self.backing[key]
+
+    def __iter__(self):
+        return iter(self.backing)
+
+    def __len__(self):
+        return len(self.backing)
+
+    def clear(self):
+        with self._lock:
+            self._ram.clear()
+        self.backing.clear()
+
+    def delete_prefix(self, prefix: str):
+        """Removes every entry whose key starts with `prefix` from both tiers."""
+        with self._lock:
+            for key in [k for k in self._ram if k.startswith(prefix)]:
+                del self._ram[key]
+        _delete_prefix(self.backing, prefix)
+
+    def close(self):
+        """Closes the backing cache, if it supports closing."""
+        close = getattr(self.backing, "close", None)
+        if close is not None:
+            close()
+
+
+def _delete_prefix(cache: MutableMapping, prefix: str):
+    """
+    Removes every entry of `cache` whose key starts with `prefix`.
+
+    Uses the cache's own `delete_prefix` when it has one; otherwise every key
+    is checked.
+    """
+    delete_prefix = getattr(cache, "delete_prefix", None)
+    if delete_prefix is not None:
+        delete_prefix(prefix)
+        return
+    for key in [k for k in cache if k.startswith(prefix)]:
+        del cache[key]
@@ -3,15 +3,22 @@
 import logging
 from collections.abc import Callable, Generator
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Dict, List
 
-from httpx import Client
+from httpx import Client, Limits
 
-from .caching import DummyCache, SQLiteCache
+from .caching import DummyCache, SQLiteCache, TieredCache, _delete_prefix
 from .comment_fetcher import CommentFetcher
 from .date_utils import parse_relative_date_string
-from .fetchers import ChannelFetcher, PlaylistFetcher, VideoFetcher
+from .fetchers import (
+    FULL_METADATA_CONCURRENCY,
+    ChannelFetcher,
+    PlaylistFetcher,
+    VideoFetcher,
+)
 from .transcript_fetcher import TranscriptFetcher
+from .utils import _HTTP2_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
@@ -22,18 +29,35 @@ class YtMeta:
     This class acts as a Facade, delegating calls to specialized fetcher classes.
     """
 
-    def __init__(self, cache_path: str | None = None):
+    def __init__(self, cache_path: str | None = None, ram_cache_entries: int = 0):
         """
         Initializes the yt-meta client.
 
         Args:
             cache_path: If provided, the path to a SQLite file for persistent,
                         on-disk caching. If None (the default), caching is disabled.
+            ram_cache_entries: If greater than zero (and `cache_path` is set),
+                        keep up to this many recently used entries in memory in
+                        front of the SQLite cache, so repeated lookups skip the
+                        database.
         """
-        self.session = Client(headers={"Accept-Language": "en-US,en;q=0.5"})
+        # Multiplex requests over HTTP/2 when the optional `h2` package is
+        # installed; full-metadata listings fetch several video pages at once.
+        # Idle connections are kept for 30s (httpx defaults to 5s) so a caller
+        # pausing between pages of a listing still reuses the warm connection.
+        self.session = Client(
+            headers={"Accept-Language": "en-US,en;q=0.5"},
+            http2=_HTTP2_AVAILABLE,
+            limits=Limits(
+                max_keepalive_connections=FULL_METADATA_CONCURRENCY,
+                keepalive_expiry=30,
+            ),
+        )
         if cache_path:
             self.cache = SQLiteCache(path=cache_path)
             logger.info(f"Using SQLite cache at: {cache_path}")
+            if ram_cache_entries > 0:
+                self.cache = TieredCache(self.cache, ram_capacity=ram_cache_entries)
         else:
             self.cache = DummyCache()
             logger.info("Caching is disabled.")
@@ -48,6 +72,27 @@ class YtMeta:
         self._comment_fetcher = CommentFetcher()
         self._transcript_fetcher = TranscriptFetcher()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Releases the client's connections, background threads and cache.
+
+        Stops the threads that prefetch continuation pages, closes the HTTP
+        connection pools and, for a persistent cache, the database connection.
+        """
+        self._channel_fetcher.close()
+        self._playlist_fetcher.close()
+        self._comment_fetcher.close()
+        self.session.close()
+        close_cache = getattr(self.cache, "close", None)
+        if close_cache is not None:
+            close_cache()
+
     @property
     def comment_fetcher(self) -> CommentFetcher:
         return self._comment_fetcher
@@ -60,9 +105,7 @@ class YtMeta:
             prefix: If provided, only keys starting with this prefix will be removed.
         """
         if prefix:
-            keys_to_remove = [k for k in self.cache if k.startswith(prefix)]
-            for k in keys_to_remove:
-                del self.cache[k]
+            _delete_prefix(self.cache, prefix)
         else:
             self.cache.clear()
 
@@ -337,3 +380,15 @@ class YtMeta:
             raise ValueError(
                 f"Invalid date format: {d}. Use 'YYYY-MM-DD' or a relative string like '2 weeks ago'."
             ) from e
+
+
+@lru_cache(maxsize=1)
+def default_client() -> YtMeta:
+    """
+    Returns a process-wide, cache-less `YtMeta` instance.
+
+    The client is created on first use and shared by every later caller, so
+    scripts and notebooks that fetch from several places reuse one HTTP
+    connection pool instead of each building their own.
+    """
+    return YtMeta()
@@ -9,9 +9,81 @@ import re
 import httpx
 
 from .exceptions import VideoUnavailableError
+from .utils import _HTTP2_AVAILABLE, _deep_get, _iter_dicts, _json_loads
 
 logger = logging.getLogger(__name__)
 
+# Where the next-page token lives inside the last item of a continuation
+# endpoint's `continuationItems`: the infinite-scroll trigger used for comment
+# pages, and the "Show more replies" button used for reply pages.
+_CONTINUATION_TOKEN_PATHS = (
+    "continuationItemRenderer.continuationEndpoint.continuationCommand.token",
+    "continuationItemRenderer.button.buttonRenderer.command.continuationCommand.token",
+)
+
+# The watch page is searched as raw bytes so the ~1 MB body is never decoded
+# to `str`; string patterns are kept for callers that pass decoded HTML.
+_YTCFG_PATTERN = r"ytcfg\.set\s*\(\s*({.+?})\s*\)"
+_INITIAL_DATA_PATTERN = r"var\s+ytInitialData\s*=\s*({.+?});"
+_YTCFG_RE = {
+    str: re.compile(_YTCFG_PATTERN, re.DOTALL),
+    bytes: re.compile(_YTCFG_PATTERN.encode(), re.DOTALL),
+}
+_INITIAL_DATA_RE = {
+    str: re.compile(_INITIAL_DATA_PATTERN, re.DOTALL),
+    bytes: re.compile(_INITIAL_DATA_PATTERN.encode(), re.DOTALL),
+}
+
+# Size of the chunks read while streaming a watch page.
+_PAGE_CHUNK_SIZE = 64 * 1024
+
+# While streaming, only the opening of each block and the first terminator
+# after it are looked for; the full patterns above run once the page is read.
+# `{` is part of the opening and `.+?` needs at least one byte after it, which
+# is where the terminator search starts.
+_YTCFG_START_RE = re.compile(rb"ytcfg\.set\s*\(\s*{")
+_YTCFG_END_RE = re.compile(rb"}\s*\)")
+_INITIAL_DATA_START_RE = re.compile(rb"var\s+ytInitialData\s*=\s*{")
+_INITIAL_DATA_END_RE = re.compile(rb"};")
+
+# Bytes re-scanned from the previous chunk, so that an opening or terminator
+# split across two chunks is still found.
+_SCAN_OVERLAP = 64
+
+
+class _BlockScanner:
+    """
+    Tells whether a `<opening>{...}<terminator>` block has fully arrived in a
+    buffer that grows one chunk at a time.
+
+    Each call only scans the bytes added since the previous call (plus
+    `_SCAN_OVERLAP`), so streaming a page stays linear in its size.
+    """
+
+    def __init__(self, start_re: re.Pattern, end_re: re.Pattern):
+        self._start_re = start_re
+        self._end_re = end_re
+        self._body_start: int | None = None
+        self._scanned = 0
+        self.found = False
+
+    def feed(self, buffer: bytearray) -> bool:
+        """Returns True once the block is complete, scanning only new bytes."""
+        if self.found:
+            return True
+
+        scan_from = max(0, self._scanned - _SCAN_OVERLAP)
+        self._scanned = len(buffer)
+        if self._body_start is None:
+            match = self._start_re.search(buffer, scan_from)
+            if match is None:
+                return False
+            self._body_start = match.end() + 1
+
+        scan_from = max(scan_from, self._body_start)
+        self.found = self._end_re.search(buffer, scan_from) is not None
+        return self.found
+
 
 class CommentAPIClient:
     """
@@ -20,9 +92,26 @@ class CommentAPIClient:
     """
 
     def __init__(
-        self, timeout: int = 30, retries: int = 3, user_agent: str | None = None
+        self,
+        timeout: int = 30,
+        retries: int = 3,
+        user_agent: str | None = None,
+        client: httpx.Client | None = None,
     ):
-        """Initialize the API client with HTTP client configuration."""
+        """
+        Initialize the API client with HTTP client configuration.
+
+        Args:
+            timeout: Request timeout in seconds. Ignored if `client` is given.
+            retries: Number of retries for failed requests.
+            user_agent: User-Agent header to send with every request. Ignored
+                if `client` is given.
+            client: An existing `httpx.Client` to reuse. Sharing one client
+                between several fetchers keeps a single warm connection pool
+                instead of paying the TLS handshake again per fetcher. It is
+                used as-is, so it must already carry the timeout and headers
+                it needs. The caller remains responsible for closing it.
+        """
         self.timeout = timeout
         self.retries = retries
         self.user_agent = user_agent or (
@@ -30,27 +119,87 @@ class CommentAPIClient:
             "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         )
 
-        self.client = httpx.Client(
-            timeout=timeout,
-            headers={"User-Agent": self.user_agent},
-            follow_redirects=True,
-        )
+        self._owns_client = client is None
+        if client is None:
+            # Keep connections to youtube.com warm between continuation
+            # requests, and multiplex them over HTTP/2 when `h2` is installed.
+            client = httpx.Client(
+                timeout=timeout,
+                headers={"User-Agent": self.user_agent},
+                follow_redirects=True,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=30),
+            )
+        self.client = client
+        self._continuation_token_paths = list(_CONTINUATION_TOKEN_PATHS)
+        # The API key and client context in ytcfg are the same on every watch
+        # page, so they are parsed from the first page and reused after that
+        self._ytcfg: dict | None = None
+        # Bumped by `refresh_context`, so callers holding on to an older ytcfg
+        # can tell that it has gone stale
+        self.context_version = 0
+
+    def close(self):
+        """Closes the HTTP client, unless it was passed in by the caller."""
+        if hasattr(self, "client") and getattr(self, "_owns_client", True):
+            self.client.close()
 
     def __del__(self):
         """Cleanup HTTP client on destruction."""
-        if hasattr(self, "client"):
-            self.client.close()
+        self.close()
+
+    def refresh_context(self):
+        """
+        Forgets the remembered ytcfg, so the next page load parses it again.
+
+        Called automatically when YouTube rejects a request with HTTP 400,
+        which is how a stale API key or client context shows up. Also bumps
+        `context_version`, so every ytcfg handed out before is treated as stale.
+        """
+        self._ytcfg = None
+        self.context_version += 1
 
     def get_initial_video_data(self, video_id: str) -> tuple[dict, dict]:
-        """Get initial video page data and ytcfg."""
+        """
+        Get initial video page data and ytcfg.
+
+        The page is streamed, and the download is abandoned as soon as both
+        ytcfg and ytInitialData have arrived; the markup that follows them is
+        never needed for comment fetching. Once a ytcfg with an API key has
+        been parsed it is reused for later videos (see `refresh_context`).
+
+        Abandoning the body means an HTTP/1.1 connection is closed rather
+        than returned to the keep-alive pool (HTTP/2 only resets the stream).
+        That is deliberate: draining the rest of the page would cost more
+        than opening a new connection for the next watch page.
+        """
         url = f"https://www.youtube.com/watch?v={video_id}"
+        ytcfg = self._ytcfg
 
         try:
-            response = self.client.get(url)
-            response.raise_for_status()
-            html_content = response.text
-
-            ytcfg = self._extract_ytcfg(html_content)
+            with self.client.stream("GET", url) as response:
+                response.raise_for_status()
+                buffer = bytearray()
+                ytcfg_scanner = (
+                    _BlockScanner(_YTCFG_START_RE, _YTCFG_END_RE)
+                    if ytcfg is None
+                    else None
+                )
+                initial_data_scanner = _BlockScanner(
+                    _INITIAL_DATA_START_RE, _INITIAL_DATA_END_RE
+                )
+                for chunk in response.iter_bytes(_PAGE_CHUNK_SIZE):
+                    buffer += chunk
+                    if (
+                        ytcfg_scanner is None or ytcfg_scanner.feed(buffer)
+                    ) and initial_data_scanner.feed(buffer):
+                        break
+            html_content = bytes(buffer)
+
+            if ytcfg is None:
+                ytcfg = self._extract_ytcfg(html_content)
+                if ytcfg.get("INNERTUBE_API_KEY"):
+                    self._ytcfg = ytcfg
             initial_data = self._extract_initial_data(html_content)
 
             return initial_data, ytcfg
@@ -58,27 +207,25 @@ class CommentAPIClient:
         except Exception as e:
             raise VideoUnavailableError(f"Could not load video page: {e}") from e
 
-    def _extract_ytcfg(self, html_content: str) -> dict:
-        """Extract ytcfg configuration from HTML."""
-        ytcfg_pattern = r"ytcfg\.set\s*\(\s*({.+?})\s*\)"
-        match = re.search(ytcfg_pattern, html_content, re.DOTALL)
+    def _extract_ytcfg(self, html_content: str | bytes) -> dict:
+        """Extract ytcfg configuration from HTML (decoded or raw bytes)."""
+        match = _YTCFG_RE[type(html_content)].search(html_content)
 
         if match:
             try:
-                return json.loads(match.group(1))
+                return _json_loads(match.group(1))
             except json.JSONDecodeError:
                 pass
 
         return {}
 
-    def _extract_initial_data(self, html_content: str) -> dict:
-        """Extract ytInitialData from HTML."""
-        initial_data_pattern = r"var\s+ytInitialData\s*=\s*({.+?});"
-        match = re.search(initial_data_pattern, html_content, re.DOTALL)
+    def _extract_initial_data(self, html_content: str | bytes) -> dict:
+        """Extract ytInitialData from HTML (decoded or raw bytes)."""
+        match = _INITIAL_DATA_RE[type(html_content)].search(html_content)
 
         if match:
             try:
-                return json.loads(match.group(1))
+                return _json_loads(match.group(1))
             except json.JSONDecodeError:
                 pass
 
@@ -100,7 +247,9 @@ class CommentAPIClient:
                 if "sortFilterSubMenuRenderer" in obj:
                     submenu = obj["sortFilterSubMenuRenderer"]
                     if "subMenuItems" in submenu:
-                        logger.debug(f"Found sortFilterSubMenuRenderer at path: {path}")
+                        logger.debug(
+                            "Found sortFilterSubMenuRenderer at path: %s", path
+                        )
                         for item in submenu["subMenuItems"]:
                             title = item.get("title", "").lower()
                             endpoint = (
@@ -285,11 +434,10 @@ class CommentAPIClient:
 
         try:
             response = self.client.post(url, json=payload)
-            response.raise_for_status()
-            return response.json()
+            return self._read_json_response(response, "API request")
 
         except Exception as e:
-            logger.error(f"API request failed: {e}")
+            logger.error("API request failed: %s", e)
             return None
 
     def extract_continuation_token(self, api_response: dict) -> str | None:
@@ -302,36 +450,60 @@ class CommentAPIClient:
         Returns:
             Next continuation token or None if not found
         """
+        token = self._find_known_continuation_token(api_response)
+        if token:
+            return token
 
-        def search_for_continuation(obj):
-            if isinstance(obj, dict):
-                # Look for continuation commands
-                if "continuationCommand" in obj:
-                    token = obj["continuationCommand"].get("token")
-                    if token and self._is_comment_token(token):
-                        return token
+        # Fall back to scanning the whole response, in document order, and
+        # stop at the first usable token
+        for obj in _iter_dicts(api_response):
+            # Look for continuation commands
+            command = obj.get("continuationCommand")
+            if isinstance(command, dict):
+                token = command.get("token")
+                if token and self._is_comment_token(token):
+                    return token
 
-                # Look for next continuation endpoints
-                if "nextContinuationData" in obj:
-                    token = obj["nextContinuationData"].get("continuation")
-                    if token:
-                        return token
+            # Look for next continuation endpoints
+            next_data = obj.get("nextContinuationData")
+            if isinstance(next_data, dict):
+                token = next_data.get("continuation")
+                if token:
+                    return token
 
-                # Recursively search all values
-                for value in obj.values():
-                    result = search_for_continuation(value)
-                    if result:
-                        return result
+        return None
 
-            elif isinstance(obj, list):
-                for item in obj:
-                    result = search_for_continuation(item)
-                    if result:
-                        return result
+    def _find_known_continuation_token(self, api_response: dict) -> str | None:
+        """
+        Look up the next-page token at its usual location in the response.
 
+        Only the last item of each continuation endpoint is inspected, so this
+        is O(depth) rather than a walk over every comment in the page. The
+        path that matched is tried first on the next call.
+        """
+        if not isinstance(api_response, dict):
             return None
 
-        return search_for_continuation(api_response)
+        endpoints = api_response.get("onResponseReceivedEndpoints") or []
+        for endpoint in reversed(endpoints):
+            for command in endpoint.values():
+                if not isinstance(command, dict):
+                    continue
+                items = command.get("continuationItems")
+                if not items:
+                    continue
+                # Work on a snapshot and swap in a reordered list, so threads
+                # sharing this client never see the list mid-update
+                paths = self._continuation_token_paths
+                for path in paths:
+                    token = _deep_get(items[-1], path)
+                    if token:
+                        if path is not paths[0]:
+                            self._continuation_token_paths = [path] + [
+                                p for p in paths if p is not path
+                            ]
+                        return token
+        return None
 
     def make_reply_request(
         self, reply_continuation_token: str, ytcfg: dict
@@ -359,9 +531,25 @@ class CommentAPIClient:
 
         try:
             response = self.client.post(url, json=payload)
-            response.raise_for_status()
-            return response.json()
+            return self._read_json_response(response, "Reply API request")
 
         except Exception as e:
-            logger.error(f"Reply API request failed: {e}")
+            logger.error("Reply API request failed: %s", e)
+            return None
+
+    def _read_json_response(self, response: httpx.Response, label: str) -> dict | None:
+        """
+        Decode a successful API response, or return None without decoding it.
+
+        Error pages (any status other than 200) and empty bodies are rejected
+        from the status line alone, before any attempt to parse them. An
+        HTTP 400, which is how a stale API key or client context shows up,
+        also calls `refresh_context`.
+        """
+        if response.status_code != 200 or not response.content:
+            logger.error("%s failed: HTTP %s", label, response.status_code)
+            if response.status_code == 400:
+                logger.warning("ytcfg will be re-read on the next page load")
+                self.refresh_context()
             return None
+        return _json_loads(response.content)
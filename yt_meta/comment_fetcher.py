@@ -3,10 +3,15 @@ Main comment fetcher that orchestrates API client and parser for comprehensive c
 """
 
 import logging
-from collections.abc import Callable, Iterator
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
 from typing import Any
 
+import httpx
+
 from .comment_api_client import CommentAPIClient
 from .comment_parser import CommentParser
 from .exceptions import VideoUnavailableError
@@ -14,6 +19,12 @@ from .utils import extract_video_id
 
 logger = logging.getLogger(__name__)
 
+# Number of videos whose ytcfg and sort endpoints are remembered per fetcher.
+_VIDEO_CONTEXT_CACHE_SIZE = 64
+
+# Default number of videos `get_comments_many` fetches at the same time.
+COMMENTS_MANY_CONCURRENCY = 4
+
 
 class CommentFetcher:
     """
@@ -22,17 +33,93 @@ class CommentFetcher:
     """
 
     def __init__(
-        self, timeout: int = 30, retries: int = 3, user_agent: str | None = None
+        self,
+        timeout: int = 30,
+        retries: int = 3,
+        user_agent: str | None = None,
+        client: httpx.Client | None = None,
     ):
-        """Initialize the comment fetcher with HTTP client configuration."""
-        self.api_client = CommentAPIClient(timeout, retries, user_agent)
+        """
+        Initialize the comment fetcher with HTTP client configuration.
+
+        Pass `client` to share one `httpx.Client` across several fetchers.
+        An injected client must already be configured as needed: `timeout`
+        and `user_agent` are only applied to a client built here, and are
+        ignored when `client` is given.
+        """
+        self.api_client = CommentAPIClient(timeout, retries, user_agent, client)
         self.parser = CommentParser()
+        self._video_contexts: OrderedDict[str, tuple[dict, dict]] = OrderedDict()
+        self._video_contexts_lock = threading.Lock()
+        # The api client's `context_version` the cached contexts were built with
+        self._video_contexts_version = self.api_client.context_version
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Closes the pooled HTTP connections.
+
+        A client passed in through `client` is left open for its owner.
+        """
+        self.api_client.close()
+
+    def refresh_context(self):
+        """
+        Forgets every remembered ytcfg and sort endpoint.
+
+        The next request for any video loads its watch page again. Use this if
+        comment requests start failing because YouTube's API key or client
+        context changed.
+        """
+        self.api_client.refresh_context()
+        with self._video_contexts_lock:
+            self._video_contexts.clear()
 
     def __del__(self):
         """Cleanup resources on destruction."""
         if hasattr(self, "api_client"):
             del self.api_client
 
+    def _get_video_context(self, video_id: str) -> tuple[dict, dict]:
+        """
+        Return the ytcfg and comment sort endpoints for a video.
+
+        The watch page is downloaded and parsed once per video; fetching the
+        same video again (e.g. with a different `sort_by`) reuses the result.
+        Only the small ytcfg and endpoint dicts are kept, not the page data.
+        Once the API client refreshes its context (e.g. after an HTTP 400),
+        every remembered context is dropped and pages are loaded again.
+        """
+        version = self.api_client.context_version
+        with self._video_contexts_lock:
+            if self._video_contexts_version != version:
+                self._video_contexts.clear()
+                self._video_contexts_version = version
+            context = self._video_contexts.get(video_id)
+            if context is not None:
+                self._video_contexts.move_to_end(video_id)
+                return context
+
+        initial_data, ytcfg = self.api_client.get_initial_video_data(video_id)
+        sort_endpoints = self.api_client.get_sort_endpoints_flexible(
+            initial_data, ytcfg
+        )
+        context = (ytcfg, sort_endpoints)
+        if sort_endpoints:
+            with self._video_contexts_lock:
+                # Don't remember a ytcfg that went stale while the page loaded
+                if self._video_contexts_version != self.api_client.context_version:
+                    return context
+                self._video_contexts[video_id] = context
+                if len(self._video_contexts) > _VIDEO_CONTEXT_CACHE_SIZE:
+                    self._video_contexts.popitem(last=False)
+        return context
+
     def get_comments(
         self,
         video_id: str,
@@ -41,6 +128,8 @@ class CommentFetcher:
         since_date: date | None = None,
         progress_callback: Callable[[int], None] | None = None,
         include_reply_continuation: bool = False,
+        initial_data: dict | None = None,
+        ytcfg: dict | None = None,
     ) -> Iterator[dict[str, Any]]:
         """
         Get comments from a YouTube video with comprehensive data extraction.
@@ -52,6 +141,10 @@ class CommentFetcher:
             since_date: Only fetch comments after this date (requires sort_by="recent")
             progress_callback: Callback function called with comment count
             include_reply_continuation: Include reply continuation tokens for comments with replies
+            initial_data: Already-parsed initial page data for this video, as
+                returned by `api_client.get_initial_video_data`. When given
+                together with `ytcfg`, the watch page is not downloaded again.
+            ytcfg: Already-parsed ytcfg for this video (see `initial_data`).
 
         Yields:
             Dict containing complete comment data, optionally including 'reply_continuation_token'
@@ -64,13 +157,14 @@ class CommentFetcher:
         logger.info(f"Fetching comments for video: {video_id}")
 
         try:
-            # Get initial video page data
-            initial_data, ytcfg = self.api_client.get_initial_video_data(video_id)
-
-            # Get comment sort endpoints with flexible detection
-            sort_endpoints = self.api_client.get_sort_endpoints_flexible(
-                initial_data, ytcfg
-            )
+            # Get comment sort endpoints with flexible detection, loading the
+            # video page only if the caller didn't already provide it
+            if initial_data is not None and ytcfg is not None:
+                sort_endpoints = self.api_client.get_sort_endpoints_flexible(
+                    initial_data, ytcfg
+                )
+            else:
+                ytcfg, sort_endpoints = self._get_video_context(video_id)
 
             if not sort_endpoints:
                 logger.warning("No comment sort endpoints found")
@@ -98,8 +192,8 @@ class CommentFetcher:
                     if not api_response:
                         break
 
-                    # Extract complete comments directly (new approach)
-                    comments = self.parser.extract_complete_comments(api_response)
+                    # Parse comments lazily so nothing past `limit` is parsed
+                    comments = self.parser.iter_complete_comments(api_response)
 
                     # Extract reply continuation tokens if requested
                     reply_tokens = {}
@@ -111,9 +205,6 @@ class CommentFetcher:
                     # Process comments
                     found_comments = False
                     for comment in comments:
-                        if limit and comment_count >= limit:
-                            break
-
                         if not comment or comment["id"] in seen_ids:
                             continue
 
@@ -137,6 +228,9 @@ class CommentFetcher:
 
                         yield comment
 
+                        if limit and comment_count >= limit:
+                            break
+
                     if not found_comments:
                         break
 
@@ -157,12 +251,60 @@ class CommentFetcher:
                 f"Could not fetch comments for video {video_id}: {e}"
             ) from e
 
+    def get_comments_many(
+        self,
+        video_ids: Iterable[str],
+        limit: int | None = None,
+        sort_by: str = "top",
+        max_workers: int = COMMENTS_MANY_CONCURRENCY,
+    ) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+        """
+        Get comments for several videos, fetching up to `max_workers` at once.
+
+        Each video's comment pages are still requested one after another, but
+        different videos are fetched on worker threads so their network
+        round-trips overlap. All workers share this fetcher's connection pool.
+
+        Args:
+            video_ids: YouTube video IDs or URLs
+            limit: Maximum number of comments to fetch per video
+            sort_by: Sort order ("top" or "recent")
+            max_workers: Maximum number of videos fetched at the same time
+
+        Yields:
+            `(video_id, comments)` tuples in the order the videos finish, not
+            the input order. Videos whose comments cannot be loaded are logged
+            and skipped.
+        """
+
+        def fetch(video_id: str) -> list[dict[str, Any]]:
+            return list(self.get_comments(video_id, limit=limit, sort_by=sort_by))
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="yt-meta-comments"
+        )
+        try:
+            futures = {
+                executor.submit(fetch, video_id): video_id for video_id in video_ids
+            }
+            for future in as_completed(futures):
+                video_id = futures[future]
+                try:
+                    comments = future.result()
+                except VideoUnavailableError as e:
+                    logger.error(f"Error fetching comments for {video_id}: {e}")
+                    continue
+                yield video_id, comments
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def get_comment_replies(
         self,
         video_id: str,
         reply_continuation_token: str,
         limit: int | None = None,
         progress_callback: Callable[[int], None] | None = None,
+        ytcfg: dict | None = None,
     ) -> Iterator[dict[str, Any]]:
         """
         Get replies for a specific comment using its reply continuation token.
@@ -172,6 +314,8 @@ class CommentFetcher:
             reply_continuation_token: Reply continuation token from a comment
             limit: Maximum number of replies to fetch
             progress_callback: Callback function called with reply count
+            ytcfg: Already-parsed ytcfg for this video. When given, the watch
+                page is not downloaded again just to read it.
 
         Yields:
             Dict containing complete reply data
@@ -180,8 +324,9 @@ class CommentFetcher:
         logger.info(f"Fetching replies for video: {video_id}")
 
         try:
-            # Get initial video page data for ytcfg
-            _, ytcfg = self.api_client.get_initial_video_data(video_id)
+            # Load the video page for ytcfg unless it is already known
+            if ytcfg is None:
+                ytcfg, _ = self._get_video_context(video_id)
 
             # Fetch replies using continuation
             reply_count = 0
@@ -198,17 +343,15 @@ class CommentFetcher:
                     if not api_response:
                         break
 
-                    # Extract replies using the same direct extraction as main comments
-                    replies = self.parser.extract_complete_comments(api_response)
+                    # Parse replies lazily, like main comments, so nothing past
+                    # `limit` is parsed
+                    replies = self.parser.iter_complete_comments(api_response)
                     replies_found = False
 
                     for reply in replies:
                         if not reply or reply["id"] in seen_ids:
                             continue
 
-                        if limit and reply_count >= limit:
-                            break
-
                         # Mark as reply and set reply-specific properties
                         reply["is_reply"] = True
                         reply["reply_count"] = 0  # Replies don't have nested replies
@@ -223,6 +366,9 @@ class CommentFetcher:
 
                         yield reply
 
+                        if limit and reply_count >= limit:
+                            break
+
                     if not replies_found:
                         break
 
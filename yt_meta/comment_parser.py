@@ -3,9 +3,11 @@ Comment parser for extracting and structuring comment data from YouTube API resp
 """
 
 import logging
+from collections.abc import Iterator
 from typing import Any
 
 from .date_utils import parse_relative_date_string
+from .utils import _iter_dicts
 
 logger = logging.getLogger(__name__)
 
@@ -28,21 +30,13 @@ class CommentParser:
         """
         payloads = []
 
-        def search_payloads(obj):
-            if isinstance(obj, dict):
-                if "commentEntityPayload" in obj:
-                    payload = obj["commentEntityPayload"]
-                    if "properties" in payload:
-                        payloads.append(payload["properties"])
-
-                for value in obj.values():
-                    search_payloads(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    search_payloads(item)
-
-        search_payloads(api_response)
-        logger.debug(f"Extracted {len(payloads)} comment payloads")
+        for obj in _iter_dicts(api_response):
+            if "commentEntityPayload" in obj:
+                payload = obj["commentEntityPayload"]
+                if "properties" in payload:
+                    payloads.append(payload["properties"])
+
+        logger.debug("Extracted %d comment payloads", len(payloads))
         return payloads
 
     def extract_author_payloads(self, api_response: dict) -> dict[str, dict]:
@@ -58,25 +52,17 @@ class CommentParser:
         """
         authors = {}
 
-        def search_authors(obj):
-            if isinstance(obj, dict):
-                if "commentEntityPayload" in obj:
-                    payload = obj["commentEntityPayload"]
-                    if "author" in payload:
-                        # Use comment key as the mapping key
-                        comment_key = payload.get("key", "")
-                        author_data = payload["author"]
-                        if comment_key:
-                            authors[comment_key] = author_data
-
-                for value in obj.values():
-                    search_authors(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    search_authors(item)
-
-        search_authors(api_response)
-        logger.debug(f"Extracted {len(authors)} author payloads")
+        for obj in _iter_dicts(api_response):
+            if "commentEntityPayload" in obj:
+                payload = obj["commentEntityPayload"]
+                if "author" in payload:
+                    # Use comment key as the mapping key
+                    comment_key = payload.get("key", "")
+                    author_data = payload["author"]
+                    if comment_key:
+                        authors[comment_key] = author_data
+
+        logger.debug("Extracted %d author payloads", len(authors))
         return authors
 
     def extract_toolbar_payloads(self, api_response: dict) -> dict[str, dict]:
@@ -92,31 +78,23 @@ class CommentParser:
         """
         toolbars = {}
 
-        def search_toolbars(obj):
-            if isinstance(obj, dict):
-                # Look for both surface and state toolbar payloads
-                for payload_type in [
-                    "engagementToolbarSurfaceEntityPayload",
-                    "engagementToolbarStateEntityPayload",
-                ]:
-                    if payload_type in obj:
-                        payload = obj[payload_type]
-                        if "key" in payload:
-                            key = payload["key"]
-                            # Merge data from both payload types
-                            if key in toolbars:
-                                toolbars[key].update(payload)
-                            else:
-                                toolbars[key] = payload.copy()
-
-                for value in obj.values():
-                    search_toolbars(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    search_toolbars(item)
-
-        search_toolbars(api_response)
-        logger.debug(f"Extracted {len(toolbars)} toolbar payloads")
+        for obj in _iter_dicts(api_response):
+            # Look for both surface and state toolbar payloads
+            for payload_type in [
+                "engagementToolbarSurfaceEntityPayload",
+                "engagementToolbarStateEntityPayload",
+            ]:
+                if payload_type in obj:
+                    payload = obj[payload_type]
+                    if "key" in payload:
+                        key = payload["key"]
+                        # Merge data from both payload types
+                        if key in toolbars:
+                            toolbars[key].update(payload)
+                        else:
+                            toolbars[key] = payload.copy()
+
+        logger.debug("Extracted %d toolbar payloads", len(toolbars))
         return toolbars
 
     def get_surface_key_mappings(self, api_response: dict) -> dict[str, str]:
@@ -131,21 +109,13 @@ class CommentParser:
         """
         mappings = {}
 
-        def search_mappings(obj):
-            if isinstance(obj, dict):
-                if "commentSurfaceKey" in obj and "commentId" in obj:
-                    surface_key = obj["commentSurfaceKey"]
-                    comment_id = obj["commentId"]
-                    mappings[surface_key] = comment_id
-
-                for value in obj.values():
-                    search_mappings(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    search_mappings(item)
-
-        search_mappings(api_response)
-        logger.debug(f"Extracted {len(mappings)} surface key mappings")
+        for obj in _iter_dicts(api_response):
+            if "commentSurfaceKey" in obj and "commentId" in obj:
+                surface_key = obj["commentSurfaceKey"]
+                comment_id = obj["commentId"]
+                mappings[surface_key] = comment_id
+
+        logger.debug("Extracted %d surface key mappings", len(mappings))
         return mappings
 
     def get_toolbar_states(self, api_response: dict) -> dict[str, dict]:
@@ -160,22 +130,14 @@ class CommentParser:
         """
         states = {}
 
-        def search_states(obj):
-            if isinstance(obj, dict):
-                if "engagementToolbarStateEntityPayload" in obj:
-                    payload = obj["engagementToolbarStateEntityPayload"]
-                    if "key" in payload:
-                        key = payload["key"]
-                        states[key] = payload
+        for obj in _iter_dicts(api_response):
+            if "engagementToolbarStateEntityPayload" in obj:
+                payload = obj["engagementToolbarStateEntityPayload"]
+                if "key" in payload:
+                    key = payload["key"]
+                    states[key] = payload
 
-                for value in obj.values():
-                    search_states(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    search_states(item)
-
-        search_states(api_response)
-        logger.debug(f"Extracted {len(states)} toolbar states")
+        logger.debug("Extracted %d toolbar states", len(states))
         return states
 
     def get_paid_comments(
@@ -193,26 +155,18 @@ class CommentParser:
         """
         paid_comments = {}
 
-        def search_paid_comments(obj):
-            if isinstance(obj, dict):
-                if "commentSurfaceEntityPayload" in obj:
-                    payload = obj["commentSurfaceEntityPayload"]
-                    if "key" in payload and "pdgCommentChip" in payload:
-                        surface_key = payload["key"]
-                        if surface_key in surface_keys:
-                            comment_id = surface_keys[surface_key]
-                            # Extract the paid amount
-                            amount = payload.get("simpleText", "Paid Comment")
-                            paid_comments[comment_id] = amount
-
-                for value in obj.values():
-                    search_paid_comments(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    search_paid_comments(item)
-
-        search_paid_comments(api_response)
-        logger.debug(f"Extracted {len(paid_comments)} paid comments")
+        for obj in _iter_dicts(api_response):
+            if "commentSurfaceEntityPayload" in obj:
+                payload = obj["commentSurfaceEntityPayload"]
+                if "key" in payload and "pdgCommentChip" in payload:
+                    surface_key = payload["key"]
+                    if surface_key in surface_keys:
+                        comment_id = surface_keys[surface_key]
+                        # Extract the paid amount
+                        amount = payload.get("simpleText", "Paid Comment")
+                        paid_comments[comment_id] = amount
+
+        logger.debug("Extracted %d paid comments", len(paid_comments))
         return paid_comments
 
     def extract_reply_continuations(self, api_response: dict) -> dict[str, str]:
@@ -227,52 +181,41 @@ class CommentParser:
         """
         reply_tokens = {}
 
-        def search_comment_threads(obj):
-            if isinstance(obj, dict):
-                if "commentThreadRenderer" in obj:
-                    thread = obj["commentThreadRenderer"]
-
-                    # Get comment ID from commentViewModel
-                    comment_id = None
-                    if "commentViewModel" in thread:
-                        view_model = thread["commentViewModel"]
-                        if "commentViewModel" in view_model:
-                            comment_id = view_model["commentViewModel"].get("commentId")
-
-                    # Look for reply continuation token
-                    if comment_id and "replies" in thread:
-                        replies = thread["replies"]
-                        if "commentRepliesRenderer" in replies:
-                            replies_renderer = replies["commentRepliesRenderer"]
-                            if "contents" in replies_renderer:
-                                contents = replies_renderer["contents"]
-                                for content in contents:
-                                    if "continuationItemRenderer" in content:
-                                        continuation_item = content[
-                                            "continuationItemRenderer"
-                                        ]
-                                        if "continuationEndpoint" in continuation_item:
-                                            endpoint = continuation_item[
-                                                "continuationEndpoint"
-                                            ]
-                                            if "continuationCommand" in endpoint:
-                                                token = endpoint[
-                                                    "continuationCommand"
-                                                ].get("token")
-                                                if token:
-                                                    reply_tokens[comment_id] = token
-                                                    logger.debug(
-                                                        f"Found reply token for comment {comment_id}: {token[:50]}..."
-                                                    )
-
-                for value in obj.values():
-                    search_comment_threads(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    search_comment_threads(item)
-
-        search_comment_threads(api_response)
-        logger.debug(f"Extracted {len(reply_tokens)} reply continuation tokens")
+        for obj in _iter_dicts(api_response):
+            if "commentThreadRenderer" not in obj:
+                continue
+            thread = obj["commentThreadRenderer"]
+
+            # Get comment ID from commentViewModel
+            comment_id = None
+            if "commentViewModel" in thread:
+                view_model = thread["commentViewModel"]
+                if "commentViewModel" in view_model:
+                    comment_id = view_model["commentViewModel"].get("commentId")
+
+            # Look for reply continuation token
+            if comment_id and "replies" in thread:
+                replies = thread["replies"]
+                if "commentRepliesRenderer" in replies:
+                    replies_renderer = replies["commentRepliesRenderer"]
+                    for content in replies_renderer.get("contents", []):
+                        if "continuationItemRenderer" not in content:
+                            continue
+                        continuation_item = content["continuationItemRenderer"]
+                        token = (
+                            continuation_item.get("continuationEndpoint", {})
+                            .get("continuationCommand", {})
+                            .get("token")
+                        )
+                        if token:
+                            reply_tokens[comment_id] = token
+                            logger.debug(
+                                "Found reply token for comment %s: %.50s...",
+                                comment_id,
+                                token,
+                            )
+
+        logger.debug("Extracted %d reply continuation tokens", len(reply_tokens))
         return reply_tokens
 
     def parse_comment_complete(
@@ -467,85 +410,91 @@ class CommentParser:
         Returns:
             List of complete comment dictionaries
         """
-        comments = []
-
-        def search_complete_comments(obj):
-            if isinstance(obj, dict):
-                if "commentEntityPayload" in obj:
-                    payload = obj["commentEntityPayload"]
-
-                    # Extract comment properties
-                    properties = payload.get("properties", {})
-                    comment_id = properties.get("commentId")
-
-                    if not comment_id:
-                        return
-
-                    # Extract text content
-                    content = properties.get("content", {})
-                    text = content.get("content", "")
-
-                    # Extract author data directly from payload
-                    author_data = payload.get("author", {})
-                    author_name = author_data.get("displayName", "Unknown")
-                    author_channel_id = author_data.get("channelId", "")
-                    author_avatar_url = author_data.get("avatarThumbnailUrl", "")
-                    is_verified = author_data.get("isVerified", False)
-                    is_creator = author_data.get("isCreator", False)
-
-                    # Extract toolbar data directly from payload
-                    toolbar_data = payload.get("toolbar", {})
-                    like_count = self._parse_engagement_count(
-                        toolbar_data.get("likeCountNotliked")
-                        or toolbar_data.get("likeCountLiked")
-                        or "0"
-                    )
-                    reply_count = self._parse_engagement_count(
-                        toolbar_data.get("replyCount", "0")
-                    )
-
-                    # Extract time information
-                    published_time = properties.get("publishedTime", "")
-                    publish_date = None
-                    if published_time:
-                        try:
-                            publish_date = parse_relative_date_string(published_time)
-                        except Exception:
-                            pass
-
-                    # Extract other properties
-                    reply_level = properties.get("replyLevel", 0)
-                    is_reply = reply_level > 0
-
-                    comment = {
-                        "id": comment_id,
-                        "text": text,
-                        "author": author_name,
-                        "author_channel_id": author_channel_id,
-                        "author_avatar_url": author_avatar_url,
-                        "publish_date": publish_date,
-                        "time_human": published_time,
-                        "time_parsed": None,
-                        "like_count": like_count,
-                        "reply_count": reply_count,
-                        "is_hearted": False,  # Can be extracted from toolbar states if needed
-                        "is_reply": is_reply,
-                        "is_pinned": False,  # Can be determined from other data if needed
-                        "paid_comment": None,
-                        "author_badges": [],  # Can be extracted from author data if needed
-                        "parent_id": None,  # For replies
-                        "is_verified": is_verified,
-                        "is_creator": is_creator,
-                    }
-
-                    comments.append(comment)
-
-                for value in obj.values():
-                    search_complete_comments(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    search_complete_comments(item)
-
-        search_complete_comments(api_response)
-        logger.debug(f"Extracted {len(comments)} complete comments directly")
+        comments = list(self.iter_complete_comments(api_response))
+        logger.debug("Extracted %d complete comments directly", len(comments))
         return comments
+
+    def iter_complete_comments(self, api_response: dict) -> Iterator[dict[str, Any]]:
+        """
+        Lazily yield complete comment data from commentEntityPayload entries.
+
+        Comments are parsed one at a time as they are consumed, so a caller that
+        stops early (e.g. once a `limit` is reached) skips parsing the rest of
+        the page.
+
+        Args:
+            api_response: API response data
+
+        Yields:
+            Complete comment dictionaries, in page order
+        """
+        for obj in _iter_dicts(api_response):
+            if "commentEntityPayload" not in obj:
+                continue
+            payload = obj["commentEntityPayload"]
+
+            # Extract comment properties
+            properties = payload.get("properties", {})
+            comment_id = properties.get("commentId")
+
+            if not comment_id:
+                continue
+
+            # Extract text content
+            content = properties.get("content", {})
+            text = content.get("content", "")
+
+            # Extract author data directly from payload
+            author_data = payload.get("author", {})
+            author_name = author_data.get("displayName", "Unknown")
+            author_channel_id = author_data.get("channelId", "")
+            author_avatar_url = author_data.get("avatarThumbnailUrl", "")
+            is_verified = author_data.get("isVerified", False)
+            is_creator = author_data.get("isCreator", False)
+
+            # Extract toolbar data directly from payload
+            toolbar_data = payload.get("toolbar", {})
+            like_count = self._parse_engagement_count(
+                toolbar_data.get("likeCountNotliked")
+                or toolbar_data.get("likeCountLiked")
+                or "0"
+            )
+            reply_count = self._parse_engagement_count(
+                toolbar_data.get("replyCount", "0")
+            )
+
+            # Extract time information
+            published_time = properties.get("publishedTime", "")
+            publish_date = None
+            if published_time:
+                try:
+                    publish_date = parse_relative_date_string(published_time)
+                except Exception:
+                    pass
+
+            # Extract other properties
+            reply_level = properties.get("replyLevel", 0)
+            is_reply = reply_level > 0
+
+            comment = {
+                "id": comment_id,
+                "text": text,
+                "author": author_name,
+                "author_channel_id": author_channel_id,
+                "author_avatar_url": author_avatar_url,
+                "publish_date": publish_date,
+                "time_human": published_time,
+                "time_parsed": None,
+                "like_count": like_count,
+                "reply_count": reply_count,
+                "is_hearted": False,  # Can be extracted from toolbar states if needed
+                "is_reply": is_reply,
+                "is_pinned": False,  # Can be determined from other data if needed
+                "paid_comment": None,
+                "author_badges": [],  # Can be extracted from author data if needed
+                "parent_id": None,  # For replies
+                "is_verified": is_verified,
+                "is_creator": is_creator,
+            }
+
+            yield comment
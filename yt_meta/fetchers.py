@@ -1,5 +1,8 @@
 import logging
-from collections.abc import MutableMapping
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
 from typing import TYPE_CHECKING
 
 import httpx
@@ -7,8 +10,8 @@ import httpx
 from . import parsing
 from .date_utils import parse_relative_date_string
 from .exceptions import MetadataParsingError, VideoUnavailableError
-from .filtering import apply_filters, partition_filters
-from .utils import _deep_get
+from .filtering import compile_filters, partition_filters
+from .utils import _VIDEO_ID_RE, _deep_get, _json_loads
 from .validators import validate_filters
 
 if TYPE_CHECKING:
@@ -16,6 +19,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Start fetching the next continuation page once this many items remain on the
+# current one, so the request overlaps with processing the rest of the page.
+PREFETCH_REMAINING_ITEMS = 10
+
+# Maximum number of video pages requested at once when full metadata is
+# needed for every video in a listing.
+FULL_METADATA_CONCURRENCY = 8
+
 
 class _BaseFetcher:
     """A base class for fetchers that process lists of videos."""
@@ -30,6 +41,7 @@ class _BaseFetcher:
         self.cache = cache
         self.video_fetcher = video_fetcher
         self.logger = logger
+        self._prefetch_executor: ThreadPoolExecutor | None = None
 
     def _process_videos_generator(
         self,
@@ -40,20 +52,89 @@ class _BaseFetcher:
         stop_at_video_id,
         max_videos,
     ):
+        passes_fast_filters = compile_filters(fast_filters)
+        passes_slow_filters = compile_filters(slow_filters)
+        videos = (video for video in video_generator if passes_fast_filters(video))
+        if must_fetch_full_metadata:
+            videos = self._with_full_metadata(
+                videos,
+                passes_slow_filters,
+                bool(slow_filters),
+                stop_at_video_id,
+                max_videos,
+            )
+        else:
+            videos = (video for video in videos if passes_slow_filters(video))
         videos_processed = 0
-        for video in video_generator:
-            if not apply_filters(video, fast_filters):
-                continue
-            merged_video = video
-            if must_fetch_full_metadata:
-                try:
+        for video in videos:
+            yield video
+            videos_processed += 1
+            if stop_at_video_id and video["video_id"] == stop_at_video_id:
+                return
+            if max_videos != -1 and videos_processed >= max_videos:
+                return
+
+    def _with_full_metadata(
+        self,
+        videos: Iterable[dict],
+        passes_slow_filters: Callable[[dict], bool],
+        skip_incomplete: bool,
+        stop_at_video_id: str | None,
+        max_videos: int,
+    ) -> Iterator[dict]:
+        """
+        Merges each video's full metadata into it, fetching several at once.
+
+        Up to `FULL_METADATA_CONCURRENCY` video pages are requested ahead of
+        the consumer on worker threads. Videos are still yielded in listing
+        order, and only if they pass `passes_slow_filters`.
+
+        No request is made that the stop conditions could make unnecessary:
+        no more pages are in flight than videos still missing from
+        `max_videos`, and nothing after `stop_at_video_id` is requested until
+        that video has been checked against the slow filters.
+
+        Args:
+            videos: The basic video dictionaries, in listing order.
+            passes_slow_filters: Check applied once full metadata is merged.
+            skip_incomplete: Drop videos whose full metadata could not be
+                extracted instead of yielding their basic data.
+            stop_at_video_id: The caller's stop video, if any.
+            max_videos: The caller's video limit, or -1 for no limit.
+        """
+        max_workers = FULL_METADATA_CONCURRENCY
+        if max_videos != -1:
+            max_workers = max(1, min(max_workers, max_videos))
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="yt-meta-metadata"
+        )
+        pending: deque[tuple[dict, Future]] = deque()
+        videos = iter(videos)
+        accepted = 0
+        waiting_for_stop_video = False
+        try:
+            while True:
+                window = max_workers
+                if max_videos != -1:
+                    window = max(1, min(window, max_videos - accepted))
+                while not waiting_for_stop_video and len(pending) < window:
+                    video = next(videos, None)
+                    if video is None:
+                        break
                     video_url = f"https://www.youtube.com/watch?v={video['video_id']}"
-                    full_meta = self.video_fetcher.get_video_metadata(video_url)
-                    if full_meta:
-                        merged_video = {**video, **full_meta}
-                    else:
-                        if slow_filters:
-                            continue
+                    future = executor.submit(
+                        self.video_fetcher.get_video_metadata, video_url
+                    )
+                    pending.append((video, future))
+                    waiting_for_stop_video = video["video_id"] == stop_at_video_id
+                if not pending:
+                    return
+
+                video, future = pending.popleft()
+                if video["video_id"] == stop_at_video_id:
+                    waiting_for_stop_video = False
+                try:
+                    full_meta = future.result()
                 except (VideoUnavailableError, MetadataParsingError) as e:
                     self.logger.error(
                         "Error fetching metadata for video_id %s: %s",
@@ -61,20 +142,121 @@ class _BaseFetcher:
                         e,
                     )
                     continue
-            if not apply_filters(merged_video, slow_filters):
-                continue
-            yield merged_video
-            videos_processed += 1
-            if stop_at_video_id and video["video_id"] == stop_at_video_id:
-                return
-            if max_videos != -1 and videos_processed >= max_videos:
-                return
+                if full_meta:
+                    video = {**video, **full_meta}
+                elif skip_incomplete:
+                    continue
+                if not passes_slow_filters(video):
+                    continue
+                accepted += 1
+                yield video
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Stops the background thread used to prefetch continuation pages.
+
+        A prefetch still queued is cancelled. The fetcher can be used again
+        afterwards; a new thread is started on the next prefetch.
+        """
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_executor = None
+
+    def _paginate(
+        self,
+        videos: list[dict],
+        continuation_token: str | None,
+        ytcfg: dict,
+        parse_continuation: Callable[[dict], tuple[list[dict], str | None]],
+        stop_at_video_id: str | None = None,
+        start_date: date | None = None,
+    ) -> Iterator[dict]:
+        """
+        Yields the videos of a listing page by page, following continuations.
+
+        Each page is checked against the stop conditions before any of it is
+        yielded, and the next page is only prefetched (once
+        `PREFETCH_REMAINING_ITEMS` videos are left) if this page cannot end
+        the listing. A page holding `stop_at_video_id` is still followed if
+        the caller asks for more, just without a prefetch.
+
+        Args:
+            videos: The videos parsed from the first page.
+            continuation_token: The token for the second page, if any.
+            ytcfg: The ytcfg of the listing's page.
+            parse_continuation: Turns a continuation response into its videos
+                and the token for the page after it.
+            stop_at_video_id: The caller's stop video, if any.
+            start_date: For newest-first listings, the page holding the first
+                video published before this date is the last one fetched.
+        """
+        # Cancelled if the caller closes the generator before it is used
+        next_page = None
+        try:
+            while True:
+                stop_pagination = start_date is not None and any(
+                    video.get("publish_date")
+                    and video["publish_date"].date() < start_date
+                    for video in videos
+                )
+                prefetch = (
+                    continuation_token
+                    and not stop_pagination
+                    and not (
+                        stop_at_video_id
+                        and any(v["video_id"] == stop_at_video_id for v in videos)
+                    )
+                )
+                prefetch_at = len(videos) - PREFETCH_REMAINING_ITEMS
+                for index, video in enumerate(videos):
+                    if prefetch and next_page is None and index >= prefetch_at:
+                        next_page = self._prefetch_continuation_data(
+                            continuation_token, ytcfg
+                        )
+                    yield video
+                if stop_pagination or not continuation_token:
+                    break
+                if next_page is not None:
+                    continuation_data = next_page.result()
+                    next_page = None
+                else:
+                    continuation_data = self._get_continuation_data(
+                        continuation_token, ytcfg
+                    )
+                if not continuation_data:
+                    break
+                videos, continuation_token = parse_continuation(continuation_data)
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    def _prefetch_continuation_data(self, token: str, ytcfg: dict) -> Future:
+        """
+        Starts fetching a continuation page on a background thread.
+
+        The returned future resolves to the same value (or raises the same
+        exception) as `_get_continuation_data`.
+        """
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="yt-meta-prefetch"
+            )
+        return self._prefetch_executor.submit(self._get_continuation_data, token, ytcfg)
 
     def _get_continuation_data(self, token: str, ytcfg: dict):
         cache_key = f"continuation:{token}"
-        if cache_key in self.cache:
+        cached = self.cache.get(cache_key)
+        if cached is not None:
             self.logger.info(f"Cache hit for continuation token: {token[:10]}...")
-            return self.cache[cache_key]
+            return cached
         data = {"context": ytcfg["INNERTUBE_CONTEXT"], "continuation": token}
         response = self.session.post(
             f"https://www.youtube.com/youtubei/v1/browse?key={ytcfg['INNERTUBE_API_KEY']}",
@@ -82,7 +264,7 @@ class _BaseFetcher:
             timeout=10,
         )
         response.raise_for_status()
-        result = response.json()
+        result = _json_loads(response.content)
         self.cache[cache_key] = result
         return result
 
@@ -105,11 +287,15 @@ class VideoFetcher:
             A dictionary containing detailed video metadata.
         """
         logger.info(f"Fetching video page: {youtube_url}")
-        video_id = youtube_url.split("v=")[-1]
+        match = _VIDEO_ID_RE.search(youtube_url)
+        video_id = match.group(1) if match else youtube_url
         cache_key = f"video_meta:{video_id}"
-        if cache_key in self.cache:
+        # A single lookup: `in` followed by `[]` would read (and, for the
+        # SQLite cache, unpickle) the entry twice
+        cached = self.cache.get(cache_key)
+        if cached is not None:
             logger.info(f"Cache hit for video metadata: {video_id}")
-            return self.cache[cache_key]
+            return cached
 
         try:
             response = self.session.get(youtube_url, timeout=10)
@@ -118,7 +304,7 @@ class VideoFetcher:
         except httpx.RequestError as e:
             logger.error(f"Failed to fetch video page {youtube_url}: {e}")
             raise VideoUnavailableError(
-                f"Failed to fetch video page: {e}", video_id=youtube_url.split("v=")[-1]
+                f"Failed to fetch video page: {e}", video_id=video_id
             ) from e
 
         player_response_data = parsing.extract_and_parse_json(
@@ -138,12 +324,9 @@ class VideoFetcher:
         return result
 
     def get_video_id(self, youtube_url: str) -> str:
-        # Basic parsing of video ID from URL
-        if "v=" in youtube_url:
-            return youtube_url.split("v=")[1].split("&")[0]
-        # Handle shorts URLs
-        if "/shorts/" in youtube_url:
-            return youtube_url.split("/shorts/")[1].split("?")[0]
+        match = _VIDEO_ID_RE.search(youtube_url)
+        if match:
+            return match.group(1)
         raise ValueError(f"Could not extract video ID from URL: {youtube_url}")
 
 
@@ -174,9 +357,10 @@ class ChannelFetcher(_BaseFetcher):
         self, channel_url: str, force_refresh: bool = False
     ) -> tuple[dict, dict, str]:
         key = self._get_channel_page_cache_key(channel_url)
-        if not force_refresh and key in self.cache:
+        cached = None if force_refresh else self.cache.get(key)
+        if cached is not None:
             self.logger.info(f"Using cached data for channel: {key}")
-            return self.cache[key]
+            return cached
         try:
             self.logger.info(f"Fetching channel page: {key}")
             response = self.session.get(key.replace("channel_page:", ""), timeout=10)
@@ -206,8 +390,9 @@ class ChannelFetcher(_BaseFetcher):
         self, channel_url: str, force_refresh: bool = False
     ) -> tuple[dict, dict, str]:
         key = self._get_channel_shorts_page_cache_key(channel_url)
-        if not force_refresh and key in self.cache:
-            return self.cache[key]
+        cached = None if force_refresh else self.cache.get(key)
+        if cached is not None:
+            return cached
         try:
             response = self.session.get(
                 key.replace("channel_shorts_page:", ""), timeout=10
@@ -281,7 +466,7 @@ class ChannelFetcher(_BaseFetcher):
         return None
 
     def _get_raw_channel_videos_generator(
-        self, channel_url, force_refresh, final_start_date
+        self, channel_url, force_refresh, final_start_date, stop_at_video_id=None
     ):
         try:
             initial_data, ytcfg, _ = self._get_channel_page_data(
@@ -299,38 +484,45 @@ class ChannelFetcher(_BaseFetcher):
             raise MetadataParsingError(
                 "Could not find videos tab renderer in channel page"
             )
-        continuation_token = self._get_continuation_token(tab_renderer)
-        renderers = self._get_video_renderers(tab_renderer)
-        while True:
-            stop_pagination = False
-            for renderer in renderers:
-                if "richItemRenderer" not in renderer:
-                    continue
-                video_data = renderer["richItemRenderer"]["content"]
-                if "videoRenderer" not in video_data:
-                    continue
-                video = parsing.parse_video_renderer(video_data["videoRenderer"])
-                if not video:
-                    continue
-                if final_start_date and video.get("publish_date"):
-                    video_publish_date = video["publish_date"]
-                    if (
-                        video_publish_date
-                        and video_publish_date.date() < final_start_date
-                    ):
-                        stop_pagination = True
-                yield video
-            if stop_pagination or not continuation_token:
-                break
-            continuation_data = self._get_continuation_data(continuation_token, ytcfg)
-            if not continuation_data:
-                break
-            continuation_token = self._get_continuation_token_from_data(
-                continuation_data
-            )
-            renderers = self._get_video_renderers_from_data(continuation_data)
+        yield from self._paginate(
+            self._parse_video_renderers(self._get_video_renderers(tab_renderer)),
+            self._get_continuation_token(tab_renderer),
+            ytcfg,
+            self._parse_videos_continuation,
+            stop_at_video_id=stop_at_video_id,
+            start_date=final_start_date,
+        )
+
+    def _parse_video_renderers(self, renderers: list) -> list[dict]:
+        videos = []
+        for renderer in renderers:
+            if "richItemRenderer" not in renderer:
+                continue
+            video_data = renderer["richItemRenderer"]["content"]
+            if "videoRenderer" not in video_data:
+                continue
+            video = parsing.parse_video_renderer(video_data["videoRenderer"])
+            if video:
+                videos.append(video)
+        return videos
+
+    def _parse_videos_continuation(self, continuation_data: dict):
+        renderers = self._get_video_renderers_from_data(continuation_data)
+        return (
+            self._parse_video_renderers(renderers),
+            self._get_continuation_token_from_data(continuation_data),
+        )
+
+    def _parse_shorts_continuation(self, continuation_data: dict):
+        renderers = self._get_video_renderers_from_data(continuation_data)
+        return (
+            parsing.extract_shorts_from_renderers(renderers)[0],
+            self._get_continuation_token_from_data(continuation_data),
+        )
 
-    def _get_raw_shorts_generator(self, channel_url, force_refresh):
+    def _get_raw_shorts_generator(
+        self, channel_url, force_refresh, stop_at_video_id=None
+    ):
         try:
             initial_data, ytcfg, _ = self._get_channel_shorts_page_data(
                 channel_url, force_refresh=force_refresh
@@ -360,33 +552,13 @@ class ChannelFetcher(_BaseFetcher):
         renderers = _deep_get(
             shorts_tab_renderer, "content.richGridRenderer.contents", []
         )
-        continuation_token = self._get_continuation_token(shorts_tab_renderer)
-
-        while True:
-            stop_pagination = False
-            for renderer in renderers:
-                if "richItemRenderer" not in renderer:
-                    continue
-                video_data = _deep_get(
-                    renderer, "richItemRenderer.content.shortsLockupViewModel"
-                )
-                if not video_data:
-                    continue
-                video = parsing.extract_shorts_from_renderers([renderer])[0][0]
-                if video:
-                    yield video
-
-            if stop_pagination or not continuation_token:
-                break
-
-            continuation_data = self._get_continuation_data(continuation_token, ytcfg)
-            if not continuation_data:
-                break
-
-            continuation_token = self._get_continuation_token_from_data(
-                continuation_data
-            )
-            renderers = self._get_video_renderers_from_data(continuation_data)
+        yield from self._paginate(
+            parsing.extract_shorts_from_renderers(renderers)[0],
+            self._get_continuation_token(shorts_tab_renderer),
+            ytcfg,
+            self._parse_shorts_continuation,
+            stop_at_video_id=stop_at_video_id,
+        )
 
     def get_channel_videos(
         self,
@@ -447,7 +619,7 @@ class ChannelFetcher(_BaseFetcher):
                 f"Slow filters {list(slow_filters.keys())} provided without fetch_full_metadata=True. Full metadata will be fetched."
             )
         raw_video_generator = self._get_raw_channel_videos_generator(
-            channel_url, force_refresh, final_start_date
+            channel_url, force_refresh, final_start_date, stop_at_video_id
         )
         yield from self._process_videos_generator(
             video_generator=raw_video_generator,
@@ -491,7 +663,7 @@ class ChannelFetcher(_BaseFetcher):
                 f"Slow filters {list(slow_filters.keys())} provided without fetch_full_metadata=True. Full metadata will be fetched."
             )
         raw_shorts_generator = self._get_raw_shorts_generator(
-            channel_url, force_refresh
+            channel_url, force_refresh, stop_at_video_id
         )
         yield from self._process_videos_generator(
             video_generator=raw_shorts_generator,
@@ -514,7 +686,9 @@ class PlaylistFetcher(_BaseFetcher):
     ):
         super().__init__(session, cache, video_fetcher)
 
-    def _get_raw_playlist_videos_generator(self, playlist_id: str):
+    def _get_raw_playlist_videos_generator(
+        self, playlist_id: str, stop_at_video_id: str | None = None
+    ):
         playlist_url = f"https://www.youtube.com/playlist?list={playlist_id}"
         try:
             response = self.session.get(playlist_url, timeout=10)
@@ -545,21 +719,21 @@ class PlaylistFetcher(_BaseFetcher):
         videos, continuation_token = parsing.extract_videos_from_playlist_renderer(
             renderer
         )
-        while True:
-            yield from videos
-            if not continuation_token:
-                break
-            continuation_data = self._get_continuation_data(continuation_token, ytcfg)
-            if not continuation_data:
-                break
-            renderers = _deep_get(
-                continuation_data,
-                "onResponseReceivedActions.0.appendContinuationItemsAction.continuationItems",
-                [],
-            )
-            videos, continuation_token = parsing.extract_videos_from_playlist_renderer(
-                {"contents": renderers}
-            )
+        yield from self._paginate(
+            videos,
+            continuation_token,
+            ytcfg,
+            self._parse_playlist_continuation,
+            stop_at_video_id=stop_at_video_id,
+        )
+
+    def _parse_playlist_continuation(self, continuation_data: dict):
+        renderers = _deep_get(
+            continuation_data,
+            "onResponseReceivedActions.0.appendContinuationItemsAction.continuationItems",
+            [],
+        )
+        return parsing.extract_videos_from_playlist_renderer({"contents": renderers})
 
     def get_playlist_videos(
         self,
@@ -603,7 +777,9 @@ class PlaylistFetcher(_BaseFetcher):
                 filters["publish_date"] = ("<=", end_date)
         fast_filters, slow_filters = partition_filters(filters, content_type="videos")
         yield from self._process_videos_generator(
-            video_generator=self._get_raw_playlist_videos_generator(playlist_id),
+            video_generator=self._get_raw_playlist_videos_generator(
+                playlist_id, stop_at_video_id
+            ),
             must_fetch_full_metadata=fetch_full_metadata or bool(slow_filters),
             fast_filters=fast_filters,
             slow_filters=slow_filters,
@@ -8,8 +8,12 @@ set of specified criteria.
 """
 
 import logging
+import operator
 import re
+from collections.abc import Callable
 from datetime import date, datetime
+from functools import lru_cache
+from typing import Any
 
 import dateparser
 
@@ -77,159 +81,236 @@ def partition_filters(filters: dict, content_type: str) -> tuple[dict, dict]:
     return fast_filters, slow_filters
 
 
-def _check_numerical_condition(video_value, condition_dict) -> bool:
+def _never(value) -> bool:
+    """A compiled check for a condition that can never be met."""
+    return False
+
+
+_COMPARISONS = {
+    "eq": operator.eq,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+_DATE_COMPARISONS = {**_COMPARISONS, "after": operator.gt, "before": operator.lt}
+
+
+def _compile_numerical_condition(condition_dict) -> Callable[[Any], bool]:
     """
-    Checks if a numerical video value meets all conditions in the dictionary.
+    Compiles a numerical condition dictionary into a check function.
     Supports gt, gte, lt, lte, eq.
     """
+    comparisons = []
     for op, filter_value in condition_dict.items():
-        if op == "eq":
-            if not video_value == filter_value:
-                return False
-        elif op == "gt":
-            if not video_value > filter_value:
-                return False
-        elif op == "gte":
-            if not video_value >= filter_value:
-                return False
-        elif op == "lt":
-            if not video_value < filter_value:
-                return False
-        elif op == "lte":
-            if not video_value <= filter_value:
-                return False
-        else:  # Should be unreachable due to validator
-            return False
-    return True
+        if op not in _COMPARISONS:  # Should be unreachable due to validator
+            return _never
+        comparisons.append((_COMPARISONS[op], filter_value))
 
+    def check(video_value) -> bool:
+        return all(compare(video_value, value) for compare, value in comparisons)
 
-def _check_date_condition(video_value, filter_value, op) -> bool:
+    return check
+
+
+def _to_date(value) -> date | None:
+    """Converts a date, datetime or date string to a date, or None on failure."""
+    if isinstance(value, str):
+        value = dateparser.parse(value, settings={"PREFER_DATES_FROM": "past"})
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return None
+
+
+def _compile_date_condition(condition_dict) -> Callable[[Any], bool]:
     """
-    Checks if a date video value meets a single condition.
+    Compiles a date condition dictionary into a check function.
     Supports gt, gte, lt, lte, eq, after, before.
+
+    Filter values are parsed once here; only the video's own date is parsed
+    per check.
     """
-    # Ensure both values are datetime objects before comparison
-    if isinstance(video_value, str):
-        video_value = dateparser.parse(
-            video_value, settings={"PREFER_DATES_FROM": "past"}
-        )
-    if isinstance(filter_value, str):
-        filter_value = dateparser.parse(
-            filter_value, settings={"PREFER_DATES_FROM": "past"}
-        )
+    comparisons = []
+    for op, filter_value in condition_dict.items():
+        filter_date = _to_date(filter_value)
+        if op not in _DATE_COMPARISONS or filter_date is None:
+            return _never  # Cannot compare if parsing failed
+        comparisons.append((_DATE_COMPARISONS[op], filter_date))
+    if not comparisons:
+        return lambda video_value: True
+
+    def check(video_value) -> bool:
+        video_date = _to_date(video_value)
+        if video_date is None:
+            return False
+        return all(compare(video_date, value) for compare, value in comparisons)
 
-    if not isinstance(video_value, datetime | date) or not isinstance(
-        filter_value, datetime | date
-    ):
-        return False  # Cannot compare if parsing failed
-
-    # Standardize to date objects for comparison
-    comp_video_value = (
-        video_value.date() if isinstance(video_value, datetime) else video_value
-    )
-    comp_filter_value = (
-        filter_value.date() if isinstance(filter_value, datetime) else filter_value
-    )
-
-    if op == "eq":
-        return comp_video_value == comp_filter_value
-    if op in ("gt", "after"):
-        return comp_video_value > comp_filter_value
-    if op == "gte":
-        return comp_video_value >= comp_filter_value
-    if op in ("lt", "before"):
-        return comp_video_value < comp_filter_value
-    if op == "lte":
-        return comp_video_value <= comp_filter_value
-
-    return False  # Should be unreachable due to validator
+    return check
 
 
-def _check_text_condition(video_value, condition_dict) -> bool:
+@lru_cache(maxsize=256)
+def _compile_text_pattern(pattern: str) -> re.Pattern:
+    """
+    Compiles a user-supplied 're' filter pattern once.
+
+    Filters are evaluated against every video in a channel or playlist, so the
+    same pattern is matched many times; compiling it up front keeps the
+    per-video check to a single `search` call.
+    """
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _compile_text_condition(condition_dict) -> Callable[[Any], bool]:
     """
-    Checks if a text video value meets all conditions in the dictionary.
-    Supports 'contains', 're', and 'eq'.
+    Compiles a text condition dictionary into a check function.
+    Supports 'contains', 'contains_any', 'contains_all', 're', and 'eq'.
+
+    Needles are lowercased once here, and each video value is lowercased
+    once per check however many conditions there are.
     """
+    required = []  # Substrings that must all be present
+    alternatives = []  # Groups of substrings of which one must be present
+    equal_to = []
+    patterns = []
     for op, filter_value in condition_dict.items():
         if op == "contains":
-            if filter_value.lower() not in video_value.lower():
-                return False
+            required.append(filter_value.lower())
+        elif op == "contains_all":
+            required.extend(v.lower() for v in filter_value)
+        elif op == "contains_any":
+            alternatives.append(tuple(v.lower() for v in filter_value))
         elif op == "re":
-            if not re.search(filter_value, video_value, re.IGNORECASE):
-                return False
+            patterns.append(_compile_text_pattern(filter_value))
         elif op == "eq":
-            if filter_value.lower() != video_value.lower():
-                return False
+            equal_to.append(filter_value.lower())
         else:  # Should be unreachable due to validator
-            return False
-    return True
+            return _never
+
+    def check(video_value) -> bool:
+        text = video_value.lower()
+        return (
+            all(needle in text for needle in required)
+            and all(any(needle in text for needle in group) for group in alternatives)
+            and all(text == value for value in equal_to)
+            and all(pattern.search(video_value) for pattern in patterns)
+        )
 
+    return check
 
-def _check_list_condition(video_value_list, condition_dict) -> bool:
+
+def _compile_list_condition(condition_dict) -> Callable[[Any], bool]:
     """
-    Checks if a list of video values meets the conditions in the dictionary.
-    Supports 'contains_any' and 'contains_all'.
+    Compiles a list condition dictionary into a check function.
+    Supports 'contains_any' and 'contains_all', case-insensitively.
     """
-    # Ensure video_value_list is a list of lowercase strings for case-insensitive matching
-    video_value_list = [str(v).lower() for v in video_value_list]
-
-    contains_any = condition_dict.get("contains_any", [])
-    if contains_any:
-        # Ensure filter values are a list of lowercase strings
-        filter_values = [str(v).lower() for v in contains_any]
-        if not any(v in video_value_list for v in filter_values):
+    # Filter values become sets of lowercase strings, so each check is a
+    # hashed set operation rather than a scan of the list per needle
+    any_of = frozenset(str(v).lower() for v in condition_dict.get("contains_any", []))
+    all_of = frozenset(str(v).lower() for v in condition_dict.get("contains_all", []))
+
+    def check(video_value_list) -> bool:
+        values = {str(v).lower() for v in video_value_list}
+        if any_of and values.isdisjoint(any_of):
             return False
+        return all_of <= values
 
-    contains_all = condition_dict.get("contains_all", [])
-    if contains_all:
-        # Ensure filter values are a list of lowercase strings
-        filter_values = [str(v).lower() for v in contains_all]
-        if not all(v in video_value_list for v in filter_values):
-            return False
+    return check
 
-    return True
 
+def _compile_boolean_condition(condition_dict) -> Callable[[Any], bool]:
+    """
+    Compiles a boolean condition dictionary into a check function.
+    Supports 'eq'.
+    """
+    if "eq" not in condition_dict:
+        return _never
+    expected = condition_dict["eq"]
+    return lambda value: value == expected
 
-def apply_filters(video: dict, filters: dict | None) -> bool:
+
+def _check_numerical_condition(video_value, condition_dict) -> bool:
+    """Checks a numerical value against a condition dictionary."""
+    return _compile_numerical_condition(condition_dict)(video_value)
+
+
+def _check_date_condition(video_value, filter_value, op) -> bool:
+    """Checks a date value against a single date condition."""
+    return _compile_date_condition({op: filter_value})(video_value)
+
+
+def _check_text_condition(video_value, condition_dict) -> bool:
+    """Checks a text value against a condition dictionary."""
+    return _compile_text_condition(condition_dict)(video_value)
+
+
+def _check_boolean_condition(value: bool, condition_dict: dict) -> bool:
+    """Checks a boolean value against a condition dictionary."""
+    return _compile_boolean_condition(condition_dict)(value)
+
+
+_SCHEMA_COMPILERS = {
+    "numerical": _compile_numerical_condition,
+    "date": _compile_date_condition,
+    "text": _compile_text_condition,
+    "list": _compile_list_condition,
+    "bool": _compile_boolean_condition,
+}
+
+
+def compile_filters(filters: dict | None) -> Callable[[dict], bool]:
     """
-    Checks if a video dictionary passes a set of filters.
+    Compiles a filter dictionary into a single predicate.
+
+    Each condition is turned into a specialised check once, with its
+    operators resolved and its filter values normalised (lowercased,
+    date-parsed, regex-compiled), so callers that test many videos against
+    the same filters (e.g. paging through a channel) only pay for the
+    comparisons themselves.
 
     Args:
-        video: The video metadata dictionary.
         filters: The dictionary of filters to apply.
 
     Returns:
-        True if the video passes all filters, False otherwise.
+        A function taking a video dictionary and returning True if it passes
+        all filters, with the same semantics as `apply_filters`.
     """
-    if filters is None:
-        return True  # If no filters are provided, consider the video as passing
+    if not filters:
+        return lambda video: True  # No filters means every video passes
+
+    checks = [
+        (key, _SCHEMA_COMPILERS[FILTER_SCHEMA[key]["schema_type"]](condition))
+        for key, condition in filters.items()
+    ]
+
+    def predicate(video: dict) -> bool:
+        for key, check in checks:
+            video_value = video.get(key)
+            if video_value is None:
+                return False  # If the key doesn't exist, it can't match
+            if not check(video_value):
+                return False
+        return True
 
-    for key, condition in filters.items():
-        if video.get(key) is None:
-            return False  # If the key doesn't exist, it can't match
+    return predicate
 
-        schema_type = FILTER_SCHEMA[key]["schema_type"]
-        video_value = video.get(key)
 
-        passes = True  # Assume true and break on first failure
-        if schema_type == "numerical":
-            passes = _check_numerical_condition(video_value, condition)
-        elif schema_type == "date":
-            for op, condition_value in condition.items():
-                if not _check_date_condition(video_value, condition_value, op):
-                    passes = False
-                    break
-        elif schema_type == "text":
-            passes = _check_text_condition(video_value, condition)
-        elif schema_type == "list":
-            passes = _check_list_condition(video_value, condition)
-        elif schema_type == "bool":
-            passes = _check_boolean_condition(video_value, condition)
+def apply_filters(video: dict, filters: dict | None) -> bool:
+    """
+    Checks if a video dictionary passes a set of filters.
 
-        if not passes:
-            return False
+    To test many videos against the same filters, use `compile_filters` once
+    instead.
 
-    return True
+    Args:
+        video: The video metadata dictionary.
+        filters: The dictionary of filters to apply.
+
+    Returns:
+        True if the video passes all filters, False otherwise.
+    """
+    return compile_filters(filters)(video)
 
 
 def apply_comment_filters(comment: dict, filters: dict) -> bool:
@@ -272,13 +353,3 @@ def apply_comment_filters(comment: dict, filters: dict) -> bool:
         if not passes:
             return False
     return True
-
-
-def _check_boolean_condition(value: bool, condition_dict: dict) -> bool:
-    """
-    Checks if a boolean value matches the specified condition.
-    Supports 'eq'.
-    """
-    if "eq" in condition_dict:
-        return value == condition_dict["eq"]
-    return False
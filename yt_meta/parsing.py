@@ -9,7 +9,7 @@ import re
 import dateparser
 
 from .exceptions import MetadataParsingError, VideoUnavailableError
-from .utils import _deep_get
+from .utils import _deep_get, _json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +19,18 @@ YT_CFG_RE = r"ytcfg\.set\s*\(\s*({.+?})\s*\)\s*;"
 YT_INITIAL_DATA_RE = r'(?:window\s*\[\s*["\']ytInitialData["\']\s*\]|(?:var\s+)?ytInitialData)\s*=\s*({.+?});'
 YT_INITIAL_PLAYER_RESPONSE_RE = r'(?:window\s*\[\s*["\']ytInitialPlayerResponse["\']\s*\]|(?:var\s+)?ytInitialPlayerResponse)\s*=\s*({.+?});'
 
+# Compiled once at import; every page parse reuses these.
+_JSON_VARIABLE_RES = {
+    "ytInitialData": re.compile(YT_INITIAL_DATA_RE, re.DOTALL),
+    "ytInitialPlayerResponse": re.compile(YT_INITIAL_PLAYER_RESPONSE_RE, re.DOTALL),
+}
+_FIND_YTCFG_RE = re.compile(r"ytcfg\.set\s*\(\s*({.*?})\s*\)\s*;", re.DOTALL)
+_PLAYLIST_ID_RE = re.compile(r"list=([^&]+)")
 
-def _regex_search(text: str, pattern: str, default: str = "", flags: int = 0) -> str:
+
+def _regex_search(text: str, pattern: re.Pattern, default: str = "") -> str:
     """Helper to run a regex search and return the first group or a default."""
-    match = re.search(pattern, text, flags)
+    match = pattern.search(text)
     return match.group(1) if match else default
 
 
@@ -33,10 +41,10 @@ def find_ytcfg(html: str) -> dict | None:
     This data contains important context for making subsequent API requests,
     such as the INNERTUBE_API_KEY and client version.
     """
-    match = re.search(r"ytcfg\.set\s*\(\s*({.*?})\s*\)\s*;", html, re.DOTALL)
+    match = _FIND_YTCFG_RE.search(html)
     if match:
         try:
-            return json.loads(match.group(1))
+            return _json_loads(match.group(1))
         except json.JSONDecodeError:
             logger.warning("Failed to parse ytcfg JSON.")
             return None
@@ -49,18 +57,17 @@ def extract_and_parse_json(html_content: str, variable_name: str) -> dict | None
     Extracts and parses a JSON object assigned to a JavaScript variable in HTML content.
     """
     # Use the proven, robust regex for the known complex YouTube variables.
-    if variable_name == "ytInitialData":
-        pattern = YT_INITIAL_DATA_RE
-    elif variable_name == "ytInitialPlayerResponse":
-        pattern = YT_INITIAL_PLAYER_RESPONSE_RE
-    else:
+    pattern = _JSON_VARIABLE_RES.get(variable_name)
+    if pattern is None:
         # Use a simpler, more generic pattern for other variables (e.g., in tests).
         logger.warning(
             f"Using generic regex for '{variable_name}'. This is less robust and intended for simple cases."
         )
-        pattern = rf"var\s+{re.escape(variable_name)}\s*=\s*({{.*?}});"
+        pattern = re.compile(
+            rf"var\s+{re.escape(variable_name)}\s*=\s*({{.*?}});", re.DOTALL
+        )
 
-    json_str = _regex_search(html_content, pattern, flags=re.DOTALL)
+    json_str = _regex_search(html_content, pattern)
     if not json_str:
         logger.warning(
             f"Could not find JSON for '{variable_name}' using its designated regex."
@@ -68,7 +75,7 @@ def extract_and_parse_json(html_content: str, variable_name: str) -> dict | None
         return None
 
     try:
-        return json.loads(json_str)
+        return _json_loads(json_str)
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse JSON for '{variable_name}': {e}")
         return None
@@ -480,7 +487,7 @@ def parse_playlist_metadata(initial_data: dict) -> dict:
     )
     playlist_id = None
     if microformat and "urlCanonical" in microformat:
-        match = re.search(r"list=([^&]+)", microformat["urlCanonical"])
+        match = _PLAYLIST_ID_RE.search(microformat["urlCanonical"])
         if match:
             playlist_id = match.group(1)
 
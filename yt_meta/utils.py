@@ -1,4 +1,45 @@
 # yt_meta/utils.py
+import importlib.util
+import json
+import re
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+# HTTP/2 needs the optional `h2` package (installed with `httpx[http2]`).
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Matches the video ID in watch (`v=`), shorts and youtu.be URLs.
+_VIDEO_ID_RE = re.compile(r"(?:v=|/shorts/|youtu\.be/)([^&?#]+)")
+
+
+def _json_loads(data: str | bytes):
+    """
+    Parse a JSON document, using `orjson` when it is installed.
+
+    YouTube embeds multi-megabyte JSON blobs in every page, and decoding them
+    is the most expensive step of parsing. `orjson` is several times faster
+    than the standard library. Documents it is stricter about (e.g. `NaN`
+    literals) are retried with `json.loads`.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+@lru_cache(maxsize=1024)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Split a dot-separated `_deep_get` path once and remember the result."""
+    return tuple(path.split("."))
 
 
 def _deep_get(dictionary, keys, default=None):
@@ -11,8 +52,9 @@ def _deep_get(dictionary, keys, default=None):
 
     Args:
         dictionary (dict or list): The nested structure to search.
-        keys (str or list): A dot-separated string (e.g., "a.b.0.c") or a
-                            list of keys and integer indices.
+        keys (str, list or tuple): A dot-separated string (e.g., "a.b.0.c")
+                            or a sequence of keys and integer indices.
+                            String paths are split once and cached.
         default: The value to return if any key is not found. Defaults to None.
 
     Returns:
@@ -20,8 +62,8 @@ def _deep_get(dictionary, keys, default=None):
     """
     if dictionary is None:
         return default
-    if not isinstance(keys, list):
-        keys = keys.split(".")
+    if isinstance(keys, str):
+        keys = _split_path(keys)
 
     current_val = dictionary
     for key in keys:
@@ -40,6 +82,31 @@ def _deep_get(dictionary, keys, default=None):
     return current_val
 
 
+def _iter_dicts(obj):
+    """
+    Yield every dictionary nested inside a JSON-like structure.
+
+    Dictionaries are visited depth-first in document order, the same order a
+    recursive walk would produce. An explicit stack is used instead of
+    recursion so that large, deeply nested API responses do not pay for a
+    Python call frame per node.
+
+    Args:
+        obj (dict or list): The structure to walk.
+
+    Yields:
+        Each dictionary found, including `obj` itself if it is a dictionary.
+    """
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            yield current
+            stack.extend(reversed(current.values()))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+
+
 def parse_vote_count(vote_str: str) -> int:
     """
     Parses a vote count string (e.g., '1.2K', '25', '1M') into an integer.
@@ -79,17 +146,10 @@ def extract_video_id(youtube_url: str) -> str:
     ):
         return youtube_url
 
-    # Handle regular URLs
-    if "v=" in youtube_url:
-        return youtube_url.split("v=")[1].split("&")[0]
-
-    # Handle shorts URLs
-    if "/shorts/" in youtube_url:
-        return youtube_url.split("/shorts/")[1].split("?")[0]
-
-    # Handle youtu.be URLs
-    if "youtu.be/" in youtube_url:
-        return youtube_url.split("youtu.be/")[1].split("?")[0]
+    # Handle regular, shorts and youtu.be URLs
+    match = _VIDEO_ID_RE.search(youtube_url)
+    if match:
+        return match.group(1)
 
     # For testing purposes, allow any string that looks like it could be a video ID
     # This includes test strings like "test_id", "invalid_id", etc.
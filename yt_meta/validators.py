@@ -1,7 +1,7 @@
 from datetime import date, datetime
 
 NUMERIC_OPERATORS = {"gt", "gte", "lt", "lte", "eq"}
-TEXT_OPERATORS = {"contains", "re", "eq"}
+TEXT_OPERATORS = {"contains", "contains_any", "contains_all", "re", "eq"}
 LIST_OPERATORS = {"contains_any", "contains_all"}
 BOOL_OPERATORS = {"eq"}
 
@@ -64,8 +64,10 @@ def validate_filters(filters: dict):
     Validates a filter dictionary against the defined FILTER_SCHEMA.
 
     Raises:
-        ValueError: If a filter field or operator is invalid.
-        TypeError: If a filter value has an incorrect type.
+        ValueError: If a filter field or operator is invalid, or a list
+            operator is given an empty list.
+        TypeError: If a filter value has an incorrect type, or a list
+            operator's list holds anything but strings.
     """
     if not filters:
         return
@@ -89,12 +91,18 @@ def validate_filters(filters: dict):
             if field == "publish_date":
                 if isinstance(value, str | date | datetime):
                     value_type_valid = True
+            elif op in LIST_OPERATORS:
+                value_type_valid = isinstance(value, list) and all(
+                    isinstance(item, str) for item in value
+                )
+                if value_type_valid and not value:
+                    raise ValueError(
+                        f"Operator '{op}' for field '{field}' needs a non-empty list"
+                    )
             elif op in TEXT_OPERATORS and isinstance(value, str):
                 value_type_valid = True
             elif op in NUMERIC_OPERATORS and isinstance(value, int | float):
                 value_type_valid = True
-            elif op in LIST_OPERATORS and isinstance(value, list):
-                value_type_valid = True
             elif op in BOOL_OPERATORS and isinstance(value, bool):
                 value_type_valid = True
 